@@ -1,123 +1,340 @@
-import mysql.connector
+import mysql.connector.pooling
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import scipy.sparse
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.decomposition import TruncatedSVD
+from sklearn.utils import murmurhash3_32
+from sklearn.preprocessing import normalize
+from joblib import Parallel, delayed
 import pickle
+import struct
 import os
 from typing import List, Dict, Any, Tuple
 import logging
-import re
+from collections import OrderedDict
+import fulltext
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; scoring falls back to vectorized NumPy
+    njit = None
+
+try:
+    import faiss
+except ImportError:
+    # FAISS is optional; related articles fall back to exact cosine over all rows
+    faiss = None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DB_CONFIG = {
+    'host': "localhost",
+    'user': "root",
+    'password': "admin",
+    'database': "search_engine_db",
+    'use_pure': False  # C extension for faster row decoding
+}
+
+# Connections kept open for the interactive loop and index rebuilds
+POOL_SIZE = 5
+
+# Approximate nearest-neighbour index for related articles (needs faiss):
+# rows are reduced with TruncatedSVD and stored in an HNSW graph
+ANN_COMPONENTS = 128
+ANN_HNSW_NEIGHBORS = 32
+ANN_MIN_DOCUMENTS = 2000  # Exact scoring is fast enough below this
+ANN_CANDIDATES = 4  # Candidates fetched per requested result, then re-ranked exactly
+
+# Rows pulled from the server per fetch while streaming the index-build scan
+INDEX_FETCH_SIZE = 500
+
+# Model file layout: magic, pickle stream length, pickle stream, then each
+# out-of-band buffer (numpy array data) as a length-prefixed raw block
+MODEL_MAGIC = b'GOGGLES-IDX5\n'
+_LENGTH = struct.Struct('<Q')
+
+# Size of the hashed feature space (unigrams and bigrams share it)
+HASH_FEATURES = 2 ** 18
+
+# Extra weight of title terms, added on top of their weight in the full document
+TITLE_WEIGHT = 2.0
+
+# Number of (query, limit) results kept by advanced_search
+SEARCH_CACHE_SIZE = 512
+
+# The TF-IDF matrix is stored next to the model file as one .npy per array, in
+# both row-major (CSR) and column-major (CSC) layout, so neither is rebuilt on load
+MATRIX_PARTS = ('data', 'indices', 'indptr')
+MATRIX_FORMATS = ('csr', 'csc')
+
+def _dump_model(model_data: Dict[str, Any], path: str):
+    """Pickle with protocol 5, writing array buffers directly instead of copying them into the stream."""
+    buffers = []
+    stream = pickle.dumps(model_data, protocol=5, buffer_callback=buffers.append)
+    
+    with open(path, 'wb') as f:
+        f.write(MODEL_MAGIC)
+        f.write(_LENGTH.pack(len(stream)))
+        f.write(stream)
+        for buffer in buffers:
+            raw = buffer.raw()
+            f.write(_LENGTH.pack(raw.nbytes))
+            f.write(raw)
+
+def _load_model(path: str) -> Dict[str, Any]:
+    """Load a file written by _dump_model, reading each buffer straight into its own bytearray."""
+    with open(path, 'rb') as f:
+        if f.read(len(MODEL_MAGIC)) != MODEL_MAGIC:
+            raise ValueError(f"{path} is not a protocol 5 model file")
+        
+        (stream_length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+        stream = f.read(stream_length)
+        
+        buffers = []
+        while True:
+            header = f.read(_LENGTH.size)
+            if not header:
+                break
+            buffer = bytearray(_LENGTH.unpack(header)[0])
+            f.readinto(buffer)
+            buffers.append(buffer)
+    
+    return pickle.loads(stream, buffers=buffers)
+
+# Byte table for preprocess_text: lowercase letters and digits are kept,
+# everything else (including the '?' standing in for non-ASCII) becomes a space
+_PREPROCESS_TABLE = bytes(c if 97 <= c <= 122 or 48 <= c <= 57 else 32 for c in range(256))
+
+def preprocess_text(text: str) -> str:
+    """Clean and preprocess text for better search results."""
+    if not text:
+        return ""
+    
+    # Convert to lowercase, then replace special characters with spaces in one C-level pass
+    data = text.lower().encode('ascii', 'replace').translate(_PREPROCESS_TABLE)
+    
+    # Remove extra whitespace
+    return b' '.join(data.split()).decode('ascii')
+
+def _accumulate_postings(scores, indptr, indices, data, query_terms, query_weights):
+    """Add query_weight * document weight to scores for every posting of the query terms."""
+    for j in range(query_terms.shape[0]):
+        term_id = query_terms[j]
+        query_weight = query_weights[j]
+        for p in range(indptr[term_id], indptr[term_id + 1]):
+            scores[indices[p]] += query_weight * data[p]
+
+if njit is not None:
+    _accumulate_postings = njit(cache=True, fastmath=True, nogil=True)(_accumulate_postings)
+
+def _tfidf_weight(vectorizer: Pipeline, counts):
+    """Apply the fitted TF-IDF weighting to a freshly hashed count matrix in place."""
+    # TfidfTransformer scales X.data by idf_[X.indices]; copy=False skips the
+    # defensive copy of a matrix nothing else references
+    return vectorizer.named_steps['tfidf'].transform(counts, copy=False)
+
+def _tfidf_transform(vectorizer: Pipeline, documents):
+    """Hash and TF-IDF weight documents with the fitted pipeline."""
+    return _tfidf_weight(vectorizer, vectorizer.named_steps['hv'].transform(documents))
+
+def _hash_index(token: str, n_features: int) -> int:
+    """Column HashingVectorizer assigns to token (mirrors sklearn's FeatureHasher)."""
+    h = murmurhash3_32(token, seed=0)
+    if h == -2147483648:
+        # abs(-2**31) overflows int32 in sklearn's hasher; this equals abs(-2**31) % n_features
+        return (2147483647 - (n_features - 1)) % n_features
+    return abs(h) % n_features
+
 class AdvancedSearchEngine:
     def __init__(self):
-        self.db = mysql.connector.connect(
-            host="localhost",
-            user="root",
-            password="admin",
-            database="search_engine_db"
+        self._pool = mysql.connector.pooling.MySQLConnectionPool(
+            pool_name="advanced_search",
+            pool_size=POOL_SIZE,
+            **DB_CONFIG
         )
-        self.cursor = self.db.cursor()
         self.vectorizer = None
+        self._analyzer = None  # Tokenizer of the fitted HashingVectorizer, for queries
         self.tfidf_matrix = None
+        self._tfidf_csc = None  # Column-major copy of tfidf_matrix: one postings list per term
+        self._ann = None  # Optional FAISS index over SVD-reduced rows
         self.article_ids = []
+        self._id_to_idx = {}  # article id -> row in tfidf_matrix
+        self._meta = []  # (title, summary, url, word_count) per article, aligned with article_ids
         self.model_file = 'search_model.pkl'
+        self._has_title_fulltext = None  # Checked on first suggestion request
+        self._search_cache = OrderedDict()  # LRU of (index version, query, limit) -> results
+        self._index_version = 0  # Bumped whenever a new index is built or loaded
         
     def preprocess_text(self, text: str) -> str:
         """Clean and preprocess text for better search results."""
-        if not text:
-            return ""
-        
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters but keep spaces
-        text = re.sub(r'[^a-zA-Z0-9\s]', ' ', text)
-        
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        return text
+        return preprocess_text(text)
     
     def build_search_index(self):
         """Build TF-IDF search index from database content."""
         logger.info("Building search index...")
         
+        # Hold one pooled connection for the whole scan
+        with self._pool.get_connection() as conn:
+            return self._build_search_index(conn)
+    
+    def _build_search_index(self, conn) -> bool:
+        """Index every article with clean content, reading through conn."""
         # Check if table exists first
         try:
-            self.cursor.execute("SHOW TABLES LIKE 'wiki_articles'")
-            if not self.cursor.fetchone():
-                logger.error("Table 'wiki_articles' not found. Please run the crawler first.")
-                return False
+            with conn.cursor(buffered=True) as cursor:
+                cursor.execute("SHOW TABLES LIKE 'wiki_articles'")
+                if not cursor.fetchone():
+                    logger.error("Table 'wiki_articles' not found. Please run the crawler first.")
+                    return False
         except Exception as e:
             logger.error(f"Database error: {e}")
             return False
         
-        # Fetch all articles
-        self.cursor.execute("""
-            SELECT id, title, summary, clean_content 
+        # Stream articles from an unbuffered (server-side) cursor instead of materializing them all
+        cursor = conn.cursor(buffered=False)
+        cursor.execute("""
+            SELECT id, title, summary, clean_content, url, word_count
             FROM wiki_articles 
             WHERE clean_content IS NOT NULL 
             AND LENGTH(clean_content) > 100
             ORDER BY id
         """)
         
-        articles = self.cursor.fetchall()
+        article_ids = []
+        titles = []
+        meta = []
         
-        if not articles:
-            logger.warning("No articles found with clean content. Please run the crawler first to populate the database.")
-            return False
-            
-        logger.info(f"Processing {len(articles)} articles for search index")
+        def rows():
+            # Fetch in batches so the driver decodes many rows per call
+            while True:
+                batch = cursor.fetchmany(INDEX_FETCH_SIZE)
+                if not batch:
+                    return
+                yield from batch
         
-        # Prepare documents and IDs
-        documents = []
-        self.article_ids = []
+        def raw_documents():
+            for article_id, title, summary, content, url, word_count in rows():
+                article_ids.append(article_id)
+                titles.append(preprocess_text(title))
+                meta.append((title, summary, url, word_count))
+                
+                # Combine title, summary, and content; titles are boosted after fitting
+                yield f"{title} {summary} {content}"
         
-        for article_id, title, summary, content in articles:
-            # Combine title, summary, and content with weights
-            # Title gets more weight by repeating it
-            doc_text = f"{title} {title} {title} {summary} {content}"
-            doc_text = self.preprocess_text(doc_text)
-            
-            documents.append(doc_text)
-            self.article_ids.append(article_id)
+        # Preprocess on all cores; results come back in input order as they finish
+        documents = Parallel(n_jobs=-1, batch_size='auto', return_as='generator')(
+            delayed(preprocess_text)(doc) for doc in raw_documents()
+        )
         
-        if not documents:
-            logger.warning("No documents found for indexing")
+        # Create TF-IDF vectorizer: hashing needs no vocabulary dict, so counting
+        # streams in constant memory and only the IDF weights have to be fitted
+        vectorizer = Pipeline([
+            ('hv', HashingVectorizer(
+                n_features=HASH_FEATURES,
+                alternate_sign=False,  # Keep all counts positive for IDF weighting
+                stop_words='english',
+                ngram_range=(1, 2),  # Include bigrams
+                norm=None,  # Raw counts; TfidfTransformer applies the weighting
+                dtype=np.float32  # Half the bytes per weight; plenty of precision for ranking
+            )),
+            ('tfidf', TfidfTransformer(
+                sublinear_tf=True,  # Dampen very frequent terms in long articles
+                norm=None  # Rows are normalized after the title boost is added
+            ))
+        ])
+        
+        # Fit and transform documents as they arrive from the database
+        try:
+            counts = vectorizer.named_steps['hv'].transform(documents)
+            vectorizer.named_steps['tfidf'].fit(counts)
+            tfidf_matrix = _tfidf_weight(vectorizer, counts)
+        except (ValueError, StopIteration) as e:  # HashingVectorizer raises StopIteration on no input
+            if not article_ids:
+                logger.warning("No articles found with clean content. Please run the crawler first to populate the database.")
+            else:
+                logger.error(f"Could not build search index from {len(article_ids)} articles: {e}")
             return False
+        finally:
+            cursor.close()
         
-        # Create TF-IDF vectorizer
-        self.vectorizer = TfidfVectorizer(
-            max_features=10000,  # Limit vocabulary size
-            stop_words='english',
-            ngram_range=(1, 2),  # Include bigrams
-            min_df=2,  # Ignore terms that appear in less than 2 documents
-            max_df=0.8  # Ignore terms that appear in more than 80% of documents
-        )
+        logger.info(f"Processed {len(article_ids)} articles for search index")
+        
+        self.vectorizer = vectorizer
+        self._analyzer = vectorizer.named_steps['hv'].build_analyzer()
+        self.article_ids = article_ids
+        self._id_to_idx = {aid: i for i, aid in enumerate(article_ids)}
+        self._meta = meta
+        
+        # Give title terms more weight with a separate title vector instead of
+        # making the tokenizer process the title several times
+        tfidf_matrix = tfidf_matrix + TITLE_WEIGHT * _tfidf_transform(vectorizer, titles)
         
-        # Fit and transform documents
-        self.tfidf_matrix = self.vectorizer.fit_transform(documents)
+        # L2-normalize rows once so cosine similarity is a plain dot product
+        self.tfidf_matrix = normalize(tfidf_matrix, norm='l2', copy=False)
+        self._tfidf_csc = self.tfidf_matrix.tocsc()
+        self._ann = self._build_ann_index()
+        self._index_version += 1
         
         # Save the model
         self.save_model()
         
-        logger.info(f"Search index built with {len(documents)} documents and {len(self.vectorizer.vocabulary_)} features")
+        logger.info(f"Search index built with {len(self.article_ids)} documents and {self._active_features()} active features")
         return True
     
+    def _build_ann_index(self):
+        """Build the HNSW index used by get_related_articles, if FAISS is available."""
+        n_documents = self.tfidf_matrix.shape[0]
+        if faiss is None or n_documents < ANN_MIN_DOCUMENTS:
+            return None
+        
+        logger.info(f"Building ANN index over {n_documents} documents...")
+        svd = TruncatedSVD(n_components=ANN_COMPONENTS)
+        embeddings = np.ascontiguousarray(svd.fit_transform(self.tfidf_matrix), dtype=np.float32)
+        faiss.normalize_L2(embeddings)
+        
+        # Inner product on unit vectors is cosine similarity
+        index = faiss.IndexHNSWFlat(ANN_COMPONENTS, ANN_HNSW_NEIGHBORS, faiss.METRIC_INNER_PRODUCT)
+        index.add(embeddings)
+        return index
+    
+    def _matrix_file(self, fmt: str, part: str) -> str:
+        return f"{self.model_file}.{fmt}.{part}.npy"
+    
+    def _load_matrix(self, fmt: str, shape: Tuple[int, int]):
+        """Wrap the memory-mapped arrays of one saved layout without copying them."""
+        data, indices, indptr = (np.load(self._matrix_file(fmt, part), mmap_mode='r') for part in MATRIX_PARTS)
+        matrix_class = scipy.sparse.csc_matrix if fmt == 'csc' else scipy.sparse.csr_matrix
+        return matrix_class((data, indices, indptr), shape=shape)
+    
+    def _ann_file(self) -> str:
+        return f"{self.model_file}.faiss"
+    
     def save_model(self):
         """Save the trained model to disk."""
+        # Raw .npy arrays can be memory-mapped on load
+        for fmt, matrix in zip(MATRIX_FORMATS, (self.tfidf_matrix, self._tfidf_csc)):
+            for part in MATRIX_PARTS:
+                np.save(self._matrix_file(fmt, part), getattr(matrix, part))
+        
+        if self._ann is not None:
+            faiss.write_index(self._ann, self._ann_file())
+        elif os.path.exists(self._ann_file()):
+            os.remove(self._ann_file())  # Stale index from an earlier build
+        
         model_data = {
             'vectorizer': self.vectorizer,
-            'tfidf_matrix': self.tfidf_matrix,
-            'article_ids': self.article_ids
+            'matrix_shape': self.tfidf_matrix.shape,
+            'matrix_formats': MATRIX_FORMATS,
+            'article_ids': self.article_ids,
+            'article_meta': self._meta,
+            'has_ann': self._ann is not None
         }
         
-        with open(self.model_file, 'wb') as f:
-            pickle.dump(model_data, f)
+        _dump_model(model_data, self.model_file)
         
         logger.info(f"Model saved to {self.model_file}")
     
@@ -128,12 +345,29 @@ class AdvancedSearchEngine:
             return self.build_search_index()
         
         try:
-            with open(self.model_file, 'rb') as f:
-                model_data = pickle.load(f)
+            model_data = _load_model(self.model_file)
+            
+            if 'article_meta' not in model_data or 'matrix_shape' not in model_data:
+                logger.warning(f"Model file {self.model_file} has no article metadata. Rebuilding index...")
+                return self.build_search_index()
+            
+            if tuple(model_data.get('matrix_formats', ())) != MATRIX_FORMATS:
+                logger.warning(f"Model file {self.model_file} has no column-major matrix. Rebuilding index...")
+                return self.build_search_index()
             
             self.vectorizer = model_data['vectorizer']
-            self.tfidf_matrix = model_data['tfidf_matrix']
+            self._analyzer = self.vectorizer.named_steps['hv'].build_analyzer()
+            self.tfidf_matrix = self._load_matrix('csr', model_data['matrix_shape'])
+            self._tfidf_csc = self._load_matrix('csc', model_data['matrix_shape'])
+            if model_data.get('has_ann') and faiss is not None:
+                self._ann = faiss.read_index(self._ann_file())
+            else:
+                # Building one needs a full SVD; exact scoring is used until the next rebuild
+                self._ann = None
             self.article_ids = model_data['article_ids']
+            self._id_to_idx = {aid: i for i, aid in enumerate(self.article_ids)}
+            self._meta = model_data['article_meta']
+            self._index_version += 1
             
             logger.info(f"Model loaded from {self.model_file}")
             return True
@@ -141,96 +375,168 @@ class AdvancedSearchEngine:
             logger.error(f"Error loading model: {e}")
             return self.build_search_index()
     
+    def _vectorize_query(self, processed_query: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the query's (term ids, L2-normalized TF-IDF weights) without building a CSR matrix."""
+        tokens = self._analyzer(processed_query)
+        n_features = self.tfidf_matrix.shape[1]
+        hashed = np.fromiter((_hash_index(token, n_features) for token in tokens), dtype=np.int32, count=len(tokens))
+        terms, counts = np.unique(hashed, return_counts=True)
+        
+        transformer = self.vectorizer.named_steps['tfidf']
+        weights = 1.0 + np.log(counts) if transformer.sublinear_tf else counts
+        weights = (weights * transformer.idf_[terms]).astype(self._tfidf_csc.dtype)
+        
+        norm = np.linalg.norm(weights)
+        if norm > 0:
+            weights /= norm
+        
+        return terms, weights
+    
+    def _score_query(self, query_terms: np.ndarray, query_weights: np.ndarray) -> np.ndarray:
+        """Accumulate cosine scores using only the postings of the query's terms."""
+        csc = self._tfidf_csc
+        scores = np.zeros(csc.shape[0], dtype=csc.dtype)
+        
+        if njit is not None:
+            # Compiled loop straight over the postings, no temporary arrays
+            _accumulate_postings(scores, csc.indptr, csc.indices, csc.data, query_terms, query_weights)
+            return scores
+        
+        for term_id, query_weight in zip(query_terms, query_weights):
+            start, end = csc.indptr[term_id], csc.indptr[term_id + 1]
+            # Document ids within a column are unique, so fancy-index += is safe
+            scores[csc.indices[start:end]] += query_weight * csc.data[start:end]
+        
+        return scores
+    
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """Return indices of the k highest scores, best first, without a full sort."""
+        k = min(k, scores.size)
+        if k <= 0:
+            return np.empty(0, dtype=np.intp)
+        
+        top = np.argpartition(scores, -k)[-k:]
+        return top[np.argsort(-scores[top])]
+    
     def advanced_search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
         """Perform advanced TF-IDF based search."""
-        if not self.vectorizer or self.tfidf_matrix is None:
+        if self.vectorizer is None or self.tfidf_matrix is None:
             logger.error("Search index not initialized")
             return []
         
         # Preprocess query
         processed_query = self.preprocess_text(query)
         
-        # Transform query using the fitted vectorizer
-        query_vector = self.vectorizer.transform([processed_query])
+        # Repeated queries are answered from the cache until the index changes
+        cache_key = (self._index_version, processed_query, limit)
+        results = self._search_cache.get(cache_key)
+        if results is None:
+            results = self._search_processed(processed_query, limit)
+            self._search_cache[cache_key] = results
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        else:
+            self._search_cache.move_to_end(cache_key)
+        
+        # Fresh dicts, so callers that annotate results can't alter the cached ones
+        return [dict(result) for result in results]
+    
+    def _search_processed(self, processed_query: str, limit: int) -> List[Dict[str, Any]]:
+        """Score an already preprocessed query against the index."""
+        # Weight query terms the way the fitted vectorizer would
+        query_terms, query_weights = self._vectorize_query(processed_query)
         
-        # Calculate cosine similarities
-        similarities = cosine_similarity(query_vector, self.tfidf_matrix).flatten()
+        # Rows are pre-normalized, so the accumulated dot product is the cosine similarity
+        similarities = self._score_query(query_terms, query_weights)
         
         # Get top results
-        top_indices = similarities.argsort()[-limit:][::-1]
+        top_indices = self._top_k(similarities, limit)
         
         # Filter out results with very low similarity
+        top_indices = [idx for idx in top_indices if similarities[idx] > 0.01]  # Minimum threshold
+        
         results = []
         for idx in top_indices:
-            similarity_score = similarities[idx]
-            if similarity_score > 0.01:  # Minimum threshold
-                article_id = self.article_ids[idx]
-                
-                # Fetch article details
-                self.cursor.execute("""
-                    SELECT title, summary, url, word_count
-                    FROM wiki_articles 
-                    WHERE id = %s
-                """, (article_id,))
-                
-                article_data = self.cursor.fetchone()
-                if article_data:
-                    results.append({
-                        'id': article_id,
-                        'title': article_data[0],
-                        'summary': article_data[1],
-                        'url': article_data[2],
-                        'word_count': article_data[3],
-                        'relevance': float(similarity_score)
-                    })
+            # Article details are cached alongside the index
+            title, summary, url, word_count = self._meta[idx]
+            results.append({
+                'id': self.article_ids[idx],
+                'title': title,
+                'summary': summary,
+                'url': url,
+                'word_count': word_count,
+                'relevance': float(similarities[idx])
+            })
         
         return results
     
     def get_related_articles(self, article_id: int, limit: int = 10) -> List[Dict[str, Any]]:
         """Find articles similar to a given article."""
-        if not self.vectorizer or self.tfidf_matrix is None:
+        if self.vectorizer is None or self.tfidf_matrix is None:
             return []
         
-        try:
-            # Find the index of the given article
-            target_idx = self.article_ids.index(article_id)
-            
-            # Get the TF-IDF vector for this article
-            target_vector = self.tfidf_matrix[target_idx]
-            
+        # Find the index of the given article
+        target_idx = self._id_to_idx.get(article_id)
+        if target_idx is None:
+            logger.warning(f"Article ID {article_id} not found in search index")
+            return []
+        
+        # Get the TF-IDF vector for this article
+        target_vector = self.tfidf_matrix[target_idx]
+        
+        if self._ann is not None:
+            # Approximate neighbours first, then exact cosine on just those rows
+            _, neighbours = self._ann.search(self._ann.reconstruct(target_idx).reshape(1, -1),
+                                             ANN_CANDIDATES * limit + 1)
+            candidates = neighbours[0][neighbours[0] >= 0]
+            candidate_scores = (self.tfidf_matrix[candidates] @ target_vector.T).toarray().ravel()
+            similarities = dict(zip(candidates.tolist(), candidate_scores.tolist()))
+            top_indices = candidates[self._top_k(candidate_scores, limit + 1)]
+        else:
             # Calculate similarities with all other articles
-            similarities = cosine_similarity(target_vector, self.tfidf_matrix).flatten()
+            similarities = (self.tfidf_matrix @ target_vector.T).toarray().ravel()
             
             # Get top similar articles (excluding the target article itself)
-            top_indices = similarities.argsort()[-limit-1:][::-1]
-            
-            results = []
-            for idx in top_indices:
-                if idx != target_idx and similarities[idx] > 0.1:
-                    related_id = self.article_ids[idx]
-                    
-                    self.cursor.execute("""
-                        SELECT title, summary, url, word_count
-                        FROM wiki_articles 
-                        WHERE id = %s
-                    """, (related_id,))
-                    
-                    article_data = self.cursor.fetchone()
-                    if article_data:
-                        results.append({
-                            'id': related_id,
-                            'title': article_data[0],
-                            'summary': article_data[1],
-                            'url': article_data[2],
-                            'word_count': article_data[3],
-                            'similarity': float(similarities[idx])
-                        })
+            top_indices = self._top_k(similarities, limit + 1)
+        
+        top_indices = [idx for idx in top_indices if idx != target_idx and similarities[idx] > 0.1]
+        
+        results = []
+        for idx in top_indices:
+            title, summary, url, word_count = self._meta[idx]
+            results.append({
+                'id': self.article_ids[idx],
+                'title': title,
+                'summary': summary,
+                'url': url,
+                'word_count': word_count,
+                'similarity': float(similarities[idx])
+            })
+        
+        return results[:limit]
+    
+    def _check_title_fulltext(self, cursor) -> bool:
+        """Whether the ft_title FULLTEXT index used by search_suggestions exists, checked once."""
+        # The index is created by the schema setup (crawler, setup.py), never on this read path
+        if self._has_title_fulltext is None:
+            try:
+                cursor.execute("""
+                    SELECT 1 FROM information_schema.statistics
+                    WHERE table_schema = DATABASE()
+                    AND table_name = 'wiki_articles'
+                    AND index_name = 'ft_title'
+                    LIMIT 1
+                """)
+                self._has_title_fulltext = bool(cursor.fetchall())
+            except Exception as e:
+                logger.warning(f"Could not check for the title FULLTEXT index: {e}")
+                self._has_title_fulltext = False
             
-            return results[:limit]
+            if not self._has_title_fulltext:
+                logger.info("No FULLTEXT index on wiki_articles.title (run setup.py); using LIKE scan for suggestions")
         
-        except ValueError:
-            logger.warning(f"Article ID {article_id} not found in search index")
-            return []
+        return self._has_title_fulltext
     
     def search_suggestions(self, partial_query: str, limit: int = 10) -> List[str]:
         """Get search suggestions based on partial query."""
@@ -238,6 +544,49 @@ class AdvancedSearchEngine:
             return []
         
         try:
+            with self._pool.get_connection() as conn, conn.cursor() as cursor:
+                return self._search_suggestions(cursor, partial_query, limit)
+        except Exception as e:
+            logger.error(f"Error getting suggestions: {e}")
+            return []
+    
+    def _search_suggestions(self, cursor, partial_query: str, limit: int) -> List[str]:
+        """Run the suggestion query on cursor."""
+        starts_pattern = f"{partial_query}%"
+        
+        if self._check_title_fulltext(cursor):
+            # Two index-only queries: OR-ing MATCH with LIKE would make MySQL
+            # ignore the FULLTEXT index and scan the whole table.
+            # "Starts with" is a B-tree range scan on the title index
+            cursor.execute("""
+            SELECT title
+            FROM wiki_articles 
+            WHERE title LIKE %s
+            ORDER BY LENGTH(title)
+            LIMIT %s
+            """, (starts_pattern, limit))
+            suggestions = [result[0] for result in cursor.fetchall()]
+            
+            # "Contains" is a FULLTEXT prefix match, only needed to fill the remaining slots
+            boolean_query = fulltext.boolean_query(partial_query)
+            if boolean_query and len(suggestions) < limit:
+                cursor.execute("""
+                SELECT title
+                FROM wiki_articles 
+                WHERE MATCH(title) AGAINST (%s IN BOOLEAN MODE)
+                ORDER BY LENGTH(title)
+                LIMIT %s
+                """, (boolean_query, limit))
+                seen = set(suggestions)
+                for (title,) in cursor.fetchall():
+                    if len(suggestions) >= limit:
+                        break
+                    if title not in seen:
+                        seen.add(title)
+                        suggestions.append(title)
+            
+            return suggestions
+        else:
             # Search for titles that start with or contain the partial query
             sql = """
             SELECT DISTINCT title
@@ -252,27 +601,26 @@ class AdvancedSearchEngine:
             LIMIT %s
             """
             
-            starts_pattern = f"{partial_query}%"
             contains_pattern = f"%{partial_query}%"
             
-            self.cursor.execute(sql, (starts_pattern, contains_pattern, starts_pattern, limit))
-            results = self.cursor.fetchall()
-            
-            return [result[0] for result in results]
+            cursor.execute(sql, (starts_pattern, contains_pattern, starts_pattern, limit))
         
-        except Exception as e:
-            logger.error(f"Error getting suggestions: {e}")
-            return []
+        return [result[0] for result in cursor.fetchall()]
+    
+    def _active_features(self) -> int:
+        """Number of hashed features that occur in at least one document."""
+        return int(np.count_nonzero(np.diff(self._tfidf_csc.indptr)))
     
     def get_search_analytics(self) -> Dict[str, Any]:
         """Get analytics about the search index."""
-        if not self.vectorizer or self.tfidf_matrix is None:
+        if self.vectorizer is None or self.tfidf_matrix is None:
             return {}
         
+        # Hashed features have no names, so only sizes are reported
         return {
             'total_documents': self.tfidf_matrix.shape[0],
-            'vocabulary_size': len(self.vectorizer.vocabulary_),
-            'feature_names_sample': list(self.vectorizer.get_feature_names_out()[:20]),
+            'hash_features': self.tfidf_matrix.shape[1],
+            'active_features': self._active_features(),
             'matrix_density': self.tfidf_matrix.nnz / (self.tfidf_matrix.shape[0] * self.tfidf_matrix.shape[1])
         }
 
@@ -301,7 +649,7 @@ def main():
     analytics = engine.get_search_analytics()
     print(f"Search engine ready!")
     print(f"- Indexed documents: {analytics.get('total_documents', 0)}")
-    print(f"- Vocabulary size: {analytics.get('vocabulary_size', 0)}")
+    print(f"- Active features: {analytics.get('active_features', 0)}")
     print(f"- Matrix density: {analytics.get('matrix_density', 0):.4f}")
     
     print("\nCommands:")
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+ASGI entry point for the Mini Search Engine web interface
+Serves the Flask app through Uvicorn instead of the Werkzeug dev server
+"""
+
+import os
+from a2wsgi import WSGIMiddleware
+from web_search import app, POOL_SIZE
+
+# Flask views are blocking, so each worker process runs them on its own thread
+# pool. One thread per pooled MySQL connection (see web_search.POOL_SIZE) lets
+# every connection be in use at once without a request finding the pool empty.
+THREADS = POOL_SIZE
+asgi_app = WSGIMiddleware(app, workers=THREADS)
+
+HOST = '0.0.0.0'
+PORT = 5000
+# Every worker can hold all POOL_SIZE connections at once, so WORKERS * POOL_SIZE
+# must fit in MySQL's max_connections (151 by default) next to the crawler's connection
+MAX_DB_CONNECTIONS = 100
+DEFAULT_WORKERS = max(1, min(os.cpu_count() or 1, MAX_DB_CONNECTIONS // POOL_SIZE))
+WORKERS = int(os.environ.get('WEB_WORKERS', DEFAULT_WORKERS))
+
+def main():
+    """Run the web interface under Uvicorn."""
+    import uvicorn
+    
+    print("Starting Mini Search Engine Web Interface (ASGI)...")
+    print(f"Visit http://localhost:{PORT} to access the search interface")
+    if WORKERS * POOL_SIZE > MAX_DB_CONNECTIONS:
+        print(f"Warning: {WORKERS} workers x {POOL_SIZE} pooled connections may exceed MySQL's max_connections")
+    uvicorn.run("asgi:asgi_app", host=HOST, port=PORT, workers=WORKERS)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Shared crawler helpers for mass_crawler.py and script.py
+Text cleaning, quality filtering and synchronous Wikipedia API access
+"""
+
+import logging
+import re
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from typing import List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# ----------------- Wikipedia API -----------------
+API_URL = "https://en.wikipedia.org/w/api.php"
+SUMMARY_URL = "https://en.wikipedia.org/api/rest_v1/page/summary/{}"
+
+# Headers for Wikipedia API
+HEADERS = {
+    'User-Agent': 'Mini Search Engine Bot/1.0 (Educational Project; Contact: user@example.com)'
+}
+
+# Retry policy for transient Wikipedia API failures
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+REQUEST_TIMEOUT = 10  # Seconds per HTTP request
+
+# Quality thresholds
+MIN_SUMMARY_LENGTH = 100
+MIN_CONTENT_LENGTH = 1000  # Characters of article HTML
+
+# ----------------- Text Patterns -----------------
+# Control characters (including null bytes) dropped in one translate() pass
+_STRIP_TABLE = dict.fromkeys(list(range(0, 9)) + [11, 12] + list(range(14, 32)) + [127], None)
+# Runs of reference markers with their surrounding whitespace, or any whitespace run
+_COMBINED_RE = re.compile(r'(?:\s*\[[^\]]*\])+\s*|\s+')
+_GAP_RE = re.compile(r'\]\s')
+# Namespace and list-page prefixes are only checked at the start of the title
+_SKIP_PREFIXES = ('category:', 'template:', 'file:', 'portal:', 'list of', 'index of')
+_SKIP_CONTAINS = ('disambiguation', 'may refer to')
+
+# Summary and content requests for an article are issued in parallel
+_FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# ----------------- Text Cleaning -----------------
+def _collapse_match(match: re.Match) -> str:
+    """Replace a whitespace run with one space and drop reference markers."""
+    matched = match.group(0)
+    # Whitespace before, between or after markers separates words: keep one space
+    return ' ' if matched[0].isspace() or _GAP_RE.search(matched) else ''
+
+def count_words(text: str) -> int:
+    """Count words in cleaned text, whose words are separated by single spaces."""
+    return text.count(' ') + 1 if text else 0
+
+def clean_html_content(html_content: str) -> str:
+    """Extract clean text from HTML content."""
+    if not html_content:
+        return ""
+    
+    try:
+        # Parse and extract text with lxml directly; libxml2 does the work in C
+        root = lxml.html.fromstring(html_content)
+        
+        # Remove unwanted elements (collected first, since dropping mutates the tree)
+        unwanted = list(root.iter('script', 'style', 'table'))
+        for cls in ('navbox', 'infobox'):
+            unwanted.extend(el for el in root.find_class(cls) if el.tag == 'div')
+        for element in unwanted:
+            if element.getparent() is not None:
+                element.drop_tree()
+        
+        text = root.text_content()
+        # Sanitize for database - remove null bytes and control characters
+        text = text.translate(_STRIP_TABLE)
+        # Collapse whitespace and remove reference numbers in one scan
+        text = _COMBINED_RE.sub(_collapse_match, text).strip()
+        
+        return text
+    except Exception as e:
+        logger.warning(f"Error cleaning HTML content: {e}")
+        return ""
+
+# ----------------- Quality Filtering -----------------
+def is_quality_summary(title: str, summary: str) -> bool:
+    """Quality checks that only need the title and summary."""
+    # Skip namespace, list and disambiguation pages
+    title_lower = title.lower()
+    if title_lower.startswith(_SKIP_PREFIXES):
+        return False
+    
+    summary_lower = summary.lower()
+    if any(p in title_lower or p in summary_lower for p in _SKIP_CONTAINS):
+        return False
+    
+    # Require meaningful summary
+    if len(summary) < MIN_SUMMARY_LENGTH:
+        return False
+    
+    return True
+
+def is_quality_article(title: str, content: str, summary: str) -> bool:
+    """Enhanced quality filtering."""
+    if not is_quality_summary(title, summary):
+        return False
+    
+    # Require minimum content length
+    if len(content) < MIN_CONTENT_LENGTH:
+        return False
+    
+    return True
+
+def clean_and_check(title: str, summary: str, content: str) -> Tuple[str, int, bool]:
+    """Quality-check and clean one article; picklable for process pools."""
+    if not is_quality_article(title, content, summary):
+        return "", 0, False
+    
+    clean_content = clean_html_content(content)
+    return clean_content, count_words(clean_content), True
+
+# ----------------- HTTP -----------------
+def create_session(pool_size: int = 4) -> requests.Session:
+    """Keep-alive session with retries and backoff for transient API failures."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount('https://', HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=MAX_RETRIES,
+            backoff_factor=BACKOFF_FACTOR,
+            status_forcelist=list(RETRY_STATUSES)
+        )
+    ))
+    return session
+
+def get_json(session: requests.Session, url: str, params: Optional[dict] = None) -> Optional[dict]:
+    """GET a Wikipedia API URL and decode JSON (retries handled by the session)."""
+    try:
+        response = session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+    except (requests.RequestException, ValueError) as e:
+        logger.warning(f"Request failed: {e}")
+        return None
+
+def fetch_article(session: requests.Session, title: str) -> Optional[dict]:
+    """Fetch an article's summary, URL, HTML content and article links."""
+    # Summary and full content with links, fetched concurrently
+    summary_future = _FETCH_EXECUTOR.submit(get_json, session, SUMMARY_URL.format(title))
+    content_future = _FETCH_EXECUTOR.submit(get_json, session, API_URL, {
+        'action': 'parse',
+        'page': title,
+        'format': 'json'
+    })
+    summary_data = summary_future.result()
+    content_data = content_future.result()
+    
+    if summary_data is None or content_data is None:
+        return None
+    
+    parsed = content_data.get('parse', {})
+    
+    return {
+        'title': summary_data.get('title', ''),
+        'summary': summary_data.get('extract', ''),
+        'url': summary_data.get('content_urls', {}).get('desktop', {}).get('page', ''),
+        'content': parsed.get('text', {}).get('*', ''),
+        # Extract links (ns=0 -> main articles)
+        'links': [l['*'] for l in parsed.get('links', []) if l.get('ns') == 0]
+    }
+
+def fetch_category_members(session: requests.Session, category: str) -> List[Tuple[str, int]]:
+    """Fetch category members with pagination (ns=0 -> page, ns=14 -> subcategory)."""
+    members = []
+    params = {
+        'action': 'query',
+        'list': 'categorymembers',
+        'cmtitle': category,
+        'cmlimit': 500,
+        'format': 'json'
+    }
+    
+    while len(members) < 500:  # Limit per category
+        data = get_json(session, API_URL, params)
+        if data is None:
+            break
+        
+        for member in data.get('query', {}).get('categorymembers', []):
+            members.append((member['title'], member['ns']))
+        
+        # Check for continuation
+        continue_param = data.get('continue', {}).get('cmcontinue')
+        if not continue_param:
+            break
+        params['cmcontinue'] = continue_param
+    
+    return members
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Shared MySQL FULLTEXT query helpers for web_search.py and advanced_search.py
+Builds boolean-mode search strings from user input
+"""
+
+import re
+
+# Words of a query, without MySQL boolean-mode operators
+TERM_RE = re.compile(r'\w+')
+
+# InnoDB never indexes stopwords or words shorter than innodb_ft_min_token_size,
+# so requiring them (+the*) would match nothing; these mirror the server defaults
+FT_MIN_TOKEN_SIZE = 3
+FT_STOPWORDS = frozenset((
+    'a', 'about', 'an', 'are', 'as', 'at', 'be', 'by', 'com', 'de', 'en', 'for',
+    'from', 'how', 'i', 'in', 'is', 'it', 'la', 'of', 'on', 'or', 'that', 'the',
+    'this', 'to', 'was', 'what', 'when', 'where', 'who', 'will', 'with', 'und', 'www'
+))
+
+
+def boolean_query(query: str) -> str:
+    """Require every indexable word as a prefix, e.g. "what is machine lea" -> "+machine* +lea*"."""
+    # Only word characters survive, so boolean operators in the input can't leak through;
+    # stopwords and short words are dropped, since the index never contains them
+    return ' '.join(
+        f"+{term}*" for term in TERM_RE.findall(query)
+        if len(term) >= FT_MIN_TOKEN_SIZE and term.lower() not in FT_STOPWORDS
+    )
@@ -3,17 +3,28 @@
 Simple launcher for the Mini Search Engine
 """
 
-import subprocess
-import sys
-import os
+import importlib
 
-def run_command(cmd, description):
-    """Run a command and show the result."""
-    print(f"\n{description}")
-    print("=" * 50)
+def run_module(module_name, **kwargs):
+    """Import a module and run its main() in this interpreter."""
     try:
-        result = subprocess.run(cmd, shell=True)
-        return result.returncode == 0
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        print(f"Error: could not load {module_name}: {e}")
+        return False
+    except Exception as e:
+        # Modules connect to MySQL at import time, so a down or misconfigured
+        # database surfaces here (mysql.connector.Error)
+        print(f"Error: could not start {module_name}: {e}")
+        print("💡 Make sure MySQL is running and credentials are correct")
+        return False
+    
+    try:
+        module.main(**kwargs)
+        return True
+    except KeyboardInterrupt:
+        print("\nStopped.")
+        return False
     except Exception as e:
         print(f"Error: {e}")
         return False
@@ -22,8 +33,6 @@ def main():
     print("🔍 MINI SEARCH ENGINE LAUNCHER")
     print("=" * 40)
     
-    python_exe = r"C:/Users/Dell/AppData/Local/Programs/Python/Python313/python.exe"
-    
     print("\nChoose an option:")
     print("1. Start Web Interface (if you have articles)")
     print("2. Crawl TONS of articles (recommended first)")
@@ -36,21 +45,22 @@ def main():
     if choice == '1':
         print("\n🌐 Starting web interface...")
         print("Visit http://localhost:5000")
-        subprocess.run(f'"{python_exe}" web_search.py')
+        # The reloader would re-run this launcher in a child process
+        run_module('web_search', use_reloader=False)
         
     elif choice == '2':
         print("\n🚀 Starting mass crawler...")
         print("This will collect thousands of articles!")
         print("Press Ctrl+C to stop when you have enough.")
-        subprocess.run(f'"{python_exe}" mass_crawler.py')
+        run_module('mass_crawler')
         
     elif choice == '3':
         print("\n🧪 Running test crawler...")
-        subprocess.run(f'"{python_exe}" test_crawler.py')
+        run_module('test_crawler')
         
     elif choice == '4':
         print("\n🔬 Starting advanced search...")
-        subprocess.run(f'"{python_exe}" advanced_search.py')
+        run_module('advanced_search')
         
     else:
         print("\n👋 Goodbye!")
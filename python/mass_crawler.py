@@ -5,18 +5,20 @@ This crawler is designed to efficiently collect thousands of articles
 """
 
 import time
-import requests
+import asyncio
+import aiohttp
 import mysql.connector
 from collections import deque
 import logging
-from bs4 import BeautifulSoup
-import re
 from typing import List, Tuple, Optional
-import random
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import signal
-import sys
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from dataclasses import dataclass
+from operator import attrgetter
+import os
+from crawler_core import (
+    API_URL, HEADERS, MAX_RETRIES, BACKOFF_FACTOR, RETRY_STATUSES, REQUEST_TIMEOUT,
+    clean_and_check, clean_html_content, is_quality_summary, is_quality_article
+)
 
 # ----------------- Logging Setup -----------------
 logging.basicConfig(
@@ -31,14 +33,36 @@ logger = logging.getLogger(__name__)
 
 # ----------------- Configuration -----------------
 MAX_ARTICLES = 10000  # Target number of articles
-MAX_WORKERS = 5       # Number of concurrent threads
+MAX_WORKERS = 10      # Number of concurrent crawl tasks (and in-flight requests)
 BATCH_SIZE = 100      # Database batch insert size
-RATE_LIMIT = 0.2      # Seconds between requests per thread
+MAX_STATEMENT_BYTES = 16 * 1024 * 1024  # Keep multi-row INSERTs under max_allowed_packet
+COMMIT_INTERVAL = 1000  # Rows inserted per transaction commit
+
+# Secondary and FULLTEXT indexes, built once after the crawl instead of per insert.
+# An existing index on the same columns (e.g. UNIQUE(title)) satisfies an entry.
+DEFERRED_INDEXES = [
+    ('idx_title', 'BTREE', 'title'),
+    ('idx_word_count', 'BTREE', 'word_count'),
+    ('idx_created', 'BTREE', 'created_at'),
+    ('ft_idx', 'FULLTEXT', 'title,summary,clean_content'),
+    ('ft_title', 'FULLTEXT', 'title')
+]
+CONNECTION_LIMIT = 50 # Max open sockets in the aiohttp connector
+EXTRACT_BATCH_SIZE = 20  # Titles per bulk summary query (API's exlimit maximum)
 
-# Headers for Wikipedia API
-HEADERS = {
-    'User-Agent': 'Mini Search Engine Bot/1.0 (Educational Project; Contact: user@example.com)'
-}
+@dataclass
+class Article:
+    """A fetched article awaiting insert; slots avoid a per-article dict."""
+    __slots__ = ('title', 'summary', 'clean_content', 'url', 'word_count', 'links')
+    title: str
+    summary: str
+    clean_content: str
+    url: str
+    word_count: int
+    links: List[str]
+
+# Article fields in wiki_articles INSERT column order
+_ARTICLE_ROW = attrgetter('title', 'summary', 'clean_content', 'url', 'word_count')
 
 # Starting categories with high-quality articles
 SEED_CATEGORIES = [
@@ -72,49 +96,98 @@ class MassCrawler:
         
         self.db = mysql.connector.connect(
             **db_config,
-            autocommit=False
+            autocommit=False,
+            use_pure=False,
+            charset='utf8mb4',
+            collation='utf8mb4_unicode_ci'
         )
         self.cursor = self.db.cursor()
         self.setup_database()
         
+        # Bulk-load session: commits grouped over many batches
+        self.uncommitted_rows = 0
+        
         self.visited = set()
         self.queue = deque()
-        self.article_batch = []
-        self.lock = threading.Lock()
+        self.enqueued = set()  # Titles currently waiting in self.queue
+        
+        # HTTP session, request limiter and article hand-off queue are created
+        # inside the event loop
+        self.session = None
+        self.semaphore = None
+        self.write_queue = None
+        # Blocking MySQL calls run on one dedicated thread, off the event loop
+        self.db_executor = ThreadPoolExecutor(max_workers=1)
+        # CPU-bound HTML cleaning runs in worker processes, across all cores
+        self.clean_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
         
         # Load existing articles to avoid duplicates
         self.load_existing_articles()
     
     def setup_database(self):
         """Create optimized database table."""
+        # Only the primary key and UNIQUE(title) are needed while loading;
+        # ensure_indexes() adds the rest after the crawl
         self.cursor.execute("""
         CREATE TABLE IF NOT EXISTS wiki_articles (
             id INT AUTO_INCREMENT PRIMARY KEY,
             title VARCHAR(255) UNIQUE,
             summary TEXT,
-            content LONGTEXT,
             clean_content LONGTEXT,
             url VARCHAR(500),
             word_count INT DEFAULT 0,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            INDEX idx_title (title),
-            INDEX idx_word_count (word_count),
-            INDEX idx_created (created_at),
-            FULLTEXT(title, summary, clean_content)
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         """)
         self.db.commit()
     
+    def ensure_indexes(self):
+        """Build any DEFERRED_INDEXES missing from wiki_articles."""
+        try:
+            self.cursor.execute("""
+                SELECT index_type, GROUP_CONCAT(column_name ORDER BY seq_in_index)
+                FROM information_schema.statistics
+                WHERE table_schema = DATABASE()
+                AND table_name = 'wiki_articles'
+                GROUP BY index_name, index_type
+            """)
+            existing = set(self.cursor.fetchall())
+            
+            for name, index_type, columns in DEFERRED_INDEXES:
+                if (index_type, columns) in existing:
+                    continue
+                
+                # InnoDB builds one FULLTEXT index per ALTER, so add them one at a time
+                kind = 'FULLTEXT INDEX' if index_type == 'FULLTEXT' else 'INDEX'
+                logger.info(f"Building index {name} on wiki_articles({columns})...")
+                start_time = time.time()
+                self.cursor.execute(
+                    f"ALTER TABLE wiki_articles ADD {kind} {name} ({columns.replace(',', ', ')})"
+                )
+                logger.info(f"Index {name} built in {time.time() - start_time:.2f} seconds")
+        except Exception as e:
+            logger.error(f"Error building indexes: {e}")
+    
     def load_existing_articles(self):
         """Load existing article titles to avoid duplicates."""
-        self.cursor.execute("SELECT title FROM wiki_articles")
-        existing = self.cursor.fetchall()
-        self.visited.update(row[0] for row in existing)
+        # Stream titles straight into the set instead of materializing fetchall()
+        cursor = self.db.cursor(buffered=False)
+        try:
+            cursor.execute("SELECT title FROM wiki_articles")
+            self.visited.update(title for (title,) in cursor)
+        finally:
+            cursor.close()
         logger.info(f"Loaded {len(self.visited)} existing articles")
     
     def cleanup(self):
         """Cleanup database connections and resources."""
         try:
+            if hasattr(self, 'clean_pool'):
+                self.clean_pool.shutdown(wait=True)
+            if hasattr(self, 'db_executor'):
+                self.db_executor.shutdown(wait=True)
+            if hasattr(self, 'db') and self.db and self.db.is_connected():
+                self.commit_pending()
             if hasattr(self, 'cursor') and self.cursor:
                 self.cursor.close()
             if hasattr(self, 'db') and self.db:
@@ -125,126 +198,131 @@ class MassCrawler:
     
     def clean_html_content(self, html_content: str) -> str:
         """Extract clean text from HTML content."""
-        if not html_content:
-            return ""
-        
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Remove unwanted elements
-            for element in soup(["script", "style", "table", "div.navbox", "div.infobox"]):
-                element.decompose()
-            
-            text = soup.get_text()
-            text = re.sub(r'\s+', ' ', text).strip()
-            text = re.sub(r'\[.*?\]', '', text)  # Remove reference numbers
-            
-            # Sanitize for database - remove or escape problematic characters
-            text = text.replace('\x00', '')  # Remove null bytes
-            text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)  # Remove control characters
-            
-            return text
-        except Exception as e:
-            logger.warning(f"Error cleaning HTML content: {e}")
-            return ""
+        return clean_html_content(html_content)
+    
+    def is_quality_summary(self, title: str, summary: str) -> bool:
+        """Quality checks that only need the title and summary."""
+        return is_quality_summary(title, summary)
     
     def is_quality_article(self, title: str, content: str, summary: str) -> bool:
         """Enhanced quality filtering."""
-        # Skip disambiguation and list pages
-        skip_patterns = [
-            'disambiguation', 'may refer to', 'list of', 'index of',
-            'category:', 'template:', 'file:', 'portal:'
-        ]
-        
-        title_lower = title.lower()
-        summary_lower = summary.lower()
-        
-        for pattern in skip_patterns:
-            if pattern in title_lower or pattern in summary_lower:
-                return False
-        
-        # Require minimum content length
-        if len(content) < 1000:
-            return False
-        
-        # Require meaningful summary
-        if len(summary) < 100:
-            return False
-        
-        return True
+        return is_quality_article(title, content, summary)
     
-    def fetch_article(self, title: str) -> Optional[dict]:
-        """Fetch a single article with optimized error handling."""
-        if title in self.visited:
-            return None
-        
+    async def _get_json(self, url: str, params: Optional[dict] = None) -> Optional[dict]:
+        """GET a Wikipedia API URL and decode JSON, retrying transient failures."""
+        for attempt in range(MAX_RETRIES + 1):
+            async with self.semaphore:
+                async with self.session.get(url, params=params) as resp:
+                    if resp.status == 200:
+                        return await resp.json()
+                    if resp.status not in RETRY_STATUSES:
+                        return None
+            if attempt < MAX_RETRIES:
+                await asyncio.sleep(BACKOFF_FACTOR * (2 ** attempt))
+        return None
+    
+    async def fetch_summaries(self, titles: List[str]) -> List[dict]:
+        """Fetch intro extracts and URLs for up to EXTRACT_BATCH_SIZE titles in one query."""
         try:
-            # Summary endpoint
-            summary_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{title}"
-            summary_resp = requests.get(summary_url, headers=HEADERS, timeout=10)
+            data = await self._get_json(API_URL, params={
+                'action': 'query',
+                'prop': 'extracts|info',
+                'exintro': 1,
+                'explaintext': 1,
+                'exlimit': EXTRACT_BATCH_SIZE,
+                'inprop': 'url',
+                'redirects': 1,
+                'titles': '|'.join(titles),
+                'format': 'json'
+            })
+            if data is None:
+                return []
             
-            if summary_resp.status_code != 200:
-                return None
+            query = data.get('query', {})
+            pages = {
+                page['title']: page
+                for page in query.get('pages', {}).values()
+                if 'missing' not in page and 'invalid' not in page
+            }
+            # Map requested titles to the canonical page titles
+            renamed = {r['from']: r['to'] for r in query.get('normalized', [])}
+            redirects = {r['from']: r['to'] for r in query.get('redirects', [])}
             
-            summary_data = summary_resp.json()
+            summaries = []
+            for requested in titles:
+                canonical = renamed.get(requested, requested)
+                canonical = redirects.get(canonical, canonical)
+                page = pages.get(canonical)
+                if page is None:
+                    continue
+                summaries.append({
+                    'requested': requested,
+                    'title': page['title'],
+                    'summary': page.get('extract', ''),
+                    'url': page.get('fullurl', '')
+                })
+            return summaries
             
-            # Content endpoint
-            content_url = f"https://en.wikipedia.org/w/api.php?action=parse&page={title}&format=json"
-            content_resp = requests.get(content_url, headers=HEADERS, timeout=10)
+        except Exception as e:
+            logger.warning(f"Error fetching summaries for {len(titles)} titles: {e}")
+            return []
+    
+    async def fetch_article(self, info: dict) -> Optional[Article]:
+        """Fetch content and links for an article whose summary is already known."""
+        article_title = info['title']
+        try:
+            content_data = await self._get_json(API_URL, params={
+                'action': 'parse',
+                'page': article_title,
+                'format': 'json'
+            })
             
-            if content_resp.status_code != 200:
+            if content_data is None:
                 return None
             
-            content_data = content_resp.json()
-            
-            # Extract data
-            article_title = summary_data.get('title', '')
-            summary = summary_data.get('extract', '')
-            url = summary_data.get('content_urls', {}).get('desktop', {}).get('page', '')
+            summary = info['summary']
             content = content_data.get('parse', {}).get('text', {}).get('*', '')
             
-            # Quality check
-            if not self.is_quality_article(article_title, content, summary):
+            # Quality check and cleaning, off the event loop in the process pool
+            loop = asyncio.get_running_loop()
+            clean_content, word_count, is_quality = await loop.run_in_executor(
+                self.clean_pool, clean_and_check, article_title, summary, content
+            )
+            if not is_quality:
                 return None
             
-            # Clean content
-            clean_content = self.clean_html_content(content)
-            word_count = len(clean_content.split())
-            
             # Extract links for further crawling
             links = content_data.get('parse', {}).get('links', [])
             linked_titles = [l['*'] for l in links if l.get('ns') == 0]
             
-            return {
-                'title': article_title,
-                'summary': summary,
-                'content': content,
-                'clean_content': clean_content,
-                'url': url,
-                'word_count': word_count,
-                'links': linked_titles
-            }
+            return Article(
+                title=article_title,
+                summary=summary,
+                clean_content=clean_content,
+                url=info['url'],
+                word_count=word_count,
+                links=linked_titles
+            )
             
         except Exception as e:
-            logger.warning(f"Error fetching {title}: {e}")
+            logger.warning(f"Error fetching {article_title}: {e}")
             return None
     
-    def fetch_category_members(self, category: str) -> List[Tuple[str, int]]:
+    async def fetch_category_members(self, category: str) -> List[Tuple[str, int]]:
         """Fetch category members with pagination."""
         try:
             members = []
             continue_param = None
             
             while len(members) < 500:  # Limit per category
-                url = f"https://en.wikipedia.org/w/api.php?action=query&list=categorymembers&cmtitle={category}&cmlimit=500&format=json"
+                url = f"{API_URL}?action=query&list=categorymembers&cmtitle={category}&cmlimit=500&format=json"
                 if continue_param:
                     url += f"&cmcontinue={continue_param}"
                 
-                resp = requests.get(url, headers=HEADERS, timeout=10)
-                if resp.status_code != 200:
+                data = await self._get_json(url)
+                if data is None:
                     break
                 
-                data = resp.json()
                 category_members = data.get('query', {}).get('categorymembers', [])
                 
                 for member in category_members:
@@ -261,150 +339,218 @@ class MassCrawler:
             logger.error(f"Error fetching category {category}: {e}")
             return []
     
-    def batch_insert_articles(self, articles: List[dict]):
+    def _statement_chunks(self, values: List[tuple]):
+        """Split rows into groups whose text fits in one INSERT statement."""
+        chunk, chunk_bytes = [], 0
+        for row in values:
+            row_bytes = sum(len(v) for v in row[:4]) * 4  # Worst case utf8mb4 expansion
+            if chunk and chunk_bytes + row_bytes > MAX_STATEMENT_BYTES:
+                yield chunk
+                chunk, chunk_bytes = [], 0
+            chunk.append(row)
+            chunk_bytes += row_bytes
+        if chunk:
+            yield chunk
+    
+    def batch_insert_articles(self, articles: List[Article]):
         """Insert articles in batches for better performance."""
         if not articles:
             return
         
         try:
-            sql = """
-            INSERT IGNORE INTO wiki_articles 
-            (title, summary, content, clean_content, url, word_count) 
-            VALUES (%s, %s, %s, %s, %s, %s)
-            """
-            
-            # Sanitize all text fields before insertion
-            values = []
-            for a in articles:
-                try:
-                    # Ensure all text fields are properly encoded and sanitized
-                    title = str(a['title'])[:255] if a['title'] else ""
-                    summary = str(a['summary']) if a['summary'] else ""
-                    content = str(a['content']) if a['content'] else ""
-                    clean_content = str(a['clean_content']) if a['clean_content'] else ""
-                    url = str(a['url'])[:500] if a['url'] else ""
-                    word_count = int(a['word_count']) if a['word_count'] else 0
-                    
-                    values.append((title, summary, content, clean_content, url, word_count))
-                except Exception as e:
-                    logger.warning(f"Error processing article {a.get('title', 'Unknown')}: {e}")
-                    continue
+            # fetch_article always produces str fields and an int word count, and the
+            # utf8mb4 connection accepts any character, so only column lengths need
+            # enforcing (VARCHAR limits count characters, and slicing a short str is free)
+            values = [
+                (title[:255], summary, clean_content, url[:500], word_count)
+                for title, summary, clean_content, url, word_count in map(_ARTICLE_ROW, articles)
+            ]
             
             if values:
-                self.cursor.executemany(sql, values)
-                self.db.commit()
+                # Earlier batches may still be uncommitted: a failure must only undo this one
+                self.cursor.execute("SAVEPOINT batch_insert")
+                
+                # executemany() only rewrites plain INSERT INTO into multi-row form,
+                # so build multi-row INSERT IGNORE statements ourselves
+                for chunk in self._statement_chunks(values):
+                    sql = (
+                        "INSERT IGNORE INTO wiki_articles "
+                        "(title, summary, clean_content, url, word_count) VALUES "
+                        + ",".join(["(%s, %s, %s, %s, %s)"] * len(chunk))
+                    )
+                    self.cursor.execute(sql, [v for row in chunk for v in row])
                 logger.info(f"Batch inserted {len(values)} articles")
+                
+                # Amortize the redo-log flush over several batches
+                self.uncommitted_rows += len(values)
+                if self.uncommitted_rows >= COMMIT_INTERVAL:
+                    self.commit_pending()
             
         except Exception as e:
-            logger.error(f"Batch insert error: {e}")
-            self.db.rollback()
+            try:
+                self.cursor.execute("ROLLBACK TO SAVEPOINT batch_insert")
+                logger.error(f"Batch insert error: {e} ({len(articles)} articles skipped)")
+            except Exception:
+                # The server already rolled back the whole transaction (e.g. deadlock, lost connection)
+                logger.error(f"Batch insert error: {e} ({self.uncommitted_rows} uncommitted rows rolled back)")
+                self.db.rollback()
+                self.uncommitted_rows = 0
     
-    def worker_thread(self, thread_id: int):
-        """Worker thread for concurrent crawling."""
-        logger.info(f"Worker {thread_id} started")
+    def commit_pending(self):
+        """Commit rows inserted since the last commit."""
+        if self.uncommitted_rows:
+            self.db.commit()
+            logger.info(f"Committed {self.uncommitted_rows} rows")
+            self.uncommitted_rows = 0
+    
+    async def db_writer(self):
+        """Drain fetched articles into batch inserts until a None sentinel arrives."""
+        loop = asyncio.get_running_loop()
+        batch = []
+        while True:
+            article_data = await self.write_queue.get()
+            if article_data is not None:
+                batch.append(article_data)
+            
+            # Batch insert when ready, or flush the remainder on shutdown
+            if batch and (article_data is None or len(batch) >= BATCH_SIZE):
+                await loop.run_in_executor(self.db_executor, self.batch_insert_articles, batch)
+                batch = []
+            
+            if article_data is None:
+                break
+    
+    def enqueue(self, title: str):
+        """Queue a title unless it was already crawled or is already waiting."""
+        if title not in self.enqueued and title not in self.visited:
+            self.enqueued.add(title)
+            self.queue.append(title)
+    
+    def enqueue_many(self, titles):
+        """Queue new titles in bulk using set difference instead of per-title checks."""
+        new_titles = set(titles) - self.visited - self.enqueued
+        self.enqueued |= new_titles
+        self.queue.extend(new_titles)
+    
+    def next_titles(self) -> List[str]:
+        """Pop up to EXTRACT_BATCH_SIZE unvisited titles and mark them visited."""
+        titles = []
+        while self.queue and len(titles) < EXTRACT_BATCH_SIZE:
+            current = self.queue.popleft()
+            self.enqueued.discard(current)
+            if current in self.visited:
+                continue
+            # Mark before awaiting so other tasks don't fetch the same title
+            self.visited.add(current)
+            titles.append(current)
+        return titles
+    
+    async def worker(self, worker_id: int):
+        """Crawl task; all tasks share one event loop, so no locking is needed."""
+        logger.info(f"Worker {worker_id} started")
         articles_processed = 0
         
         while len(self.visited) < MAX_ARTICLES:
-            with self.lock:
-                if not self.queue:
-                    break
-                current = self.queue.popleft()
+            titles = self.next_titles()
+            if not titles:
+                break
             
-            if current in self.visited:
-                continue
+            # One bulk query for summaries, then content only for promising pages
+            candidates = []
+            for info in await self.fetch_summaries(titles):
+                if info['title'] != info['requested']:
+                    # Redirect or normalization: skip canonical pages already seen
+                    if info['title'] in self.visited:
+                        continue
+                    self.visited.add(info['title'])
+                if self.is_quality_summary(info['title'], info['summary']):
+                    candidates.append(info)
             
-            # Fetch article
-            article_data = self.fetch_article(current)
+            results = await asyncio.gather(*(self.fetch_article(info) for info in candidates))
             
-            with self.lock:
-                self.visited.add(current)
+            for article_data in results:
+                if not article_data:
+                    continue
+                # Workers never wait on MySQL; the writer task owns the inserts
+                await self.write_queue.put(article_data)
+                articles_processed += 1
                 
-                if article_data:
-                    self.article_batch.append(article_data)
-                    articles_processed += 1
-                    
-                    # Add new links to queue
-                    for link in article_data['links'][:10]:  # Limit links per article
-                        if link not in self.visited and len(self.queue) < 50000:
-                            self.queue.append(link)
-                    
-                    # Batch insert when ready
-                    if len(self.article_batch) >= BATCH_SIZE:
-                        self.batch_insert_articles(self.article_batch)
-                        self.article_batch.clear()
-            
-            # Rate limiting
-            time.sleep(RATE_LIMIT)
-            
-            if articles_processed % 50 == 0 and articles_processed > 0:
-                logger.info(f"Worker {thread_id}: {articles_processed} articles processed")
+                # Add new links to queue
+                for link in article_data.links[:10]:  # Limit links per article
+                    if len(self.queue) < 50000:
+                        self.enqueue(link)
+                
+                if articles_processed % 50 == 0:
+                    logger.info(f"Worker {worker_id}: {articles_processed} articles processed")
         
-        logger.info(f"Worker {thread_id} finished. Processed {articles_processed} articles")
+        logger.info(f"Worker {worker_id} finished. Processed {articles_processed} articles")
     
-    def populate_initial_queue(self):
+    async def populate_initial_queue(self):
         """Populate queue with articles from seed categories."""
         logger.info("Populating initial queue from seed categories...")
         
-        for category in SEED_CATEGORIES:
-            members = self.fetch_category_members(category)
+        # Category listings are independent; the request semaphore bounds concurrency
+        seed_members = await asyncio.gather(
+            *(self.fetch_category_members(category) for category in SEED_CATEGORIES)
+        )
+        
+        subcategories = []
+        for category, members in zip(SEED_CATEGORIES, seed_members):
             logger.info(f"Found {len(members)} members in {category}")
-            
-            for title, ns in members:
-                if ns == 0 and title not in self.visited:  # Articles only
-                    self.queue.append(title)
-                elif ns == 14:  # Subcategories
-                    sub_members = self.fetch_category_members(title)
-                    for sub_title, sub_ns in sub_members[:50]:  # Limit subcategory expansion
-                        if sub_ns == 0 and sub_title not in self.visited:
-                            self.queue.append(sub_title)
-            
-            time.sleep(1)  # Rate limit between categories
+            self.enqueue_many(title for title, ns in members if ns == 0)  # Articles only
+            subcategories.extend(title for title, ns in members if ns == 14)
+        
+        # Expand all subcategories concurrently as well
+        sub_members = await asyncio.gather(
+            *(self.fetch_category_members(title) for title in subcategories)
+        )
+        for members in sub_members:
+            # Limit subcategory expansion
+            self.enqueue_many(title for title, ns in members[:50] if ns == 0)
         
         logger.info(f"Initial queue populated with {len(self.queue)} articles")
     
-    def run(self):
-        """Run the mass crawler with multiple threads."""
-        logger.info(f"Starting mass crawler - Target: {MAX_ARTICLES} articles")
-        
-        # Populate initial queue
-        self.populate_initial_queue()
-        
-        if not self.queue:
-            logger.error("No articles in queue. Cannot start crawling.")
-            return
-        
-        # Start worker threads
-        try:
-            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-                futures = [
-                    executor.submit(self.worker_thread, i) 
-                    for i in range(MAX_WORKERS)
-                ]
-                
-                # Monitor progress
-                start_time = time.time()
-                while any(not f.done() for f in futures):
-                    time.sleep(30)  # Progress update every 30 seconds
-                    
-                    with self.lock:
-                        current_count = len(self.visited)
-                        queue_size = len(self.queue)
-                        elapsed = time.time() - start_time
-                        rate = current_count / elapsed if elapsed > 0 else 0
-                    
-                    logger.info(f"Progress: {current_count}/{MAX_ARTICLES} articles, {queue_size} queued, {rate:.2f} articles/sec")
-                    
-                    if current_count >= MAX_ARTICLES:
-                        logger.info("Target reached! Stopping threads...")
-                        break
-        except KeyboardInterrupt:
-            logger.info("Crawling interrupted - cleaning up threads...")
-            # The ThreadPoolExecutor context manager will handle thread cleanup
-            raise
+    async def report_progress(self, start_time: float):
+        """Log crawl progress every 30 seconds until cancelled."""
+        while True:
+            await asyncio.sleep(30)
+            current_count = len(self.visited)
+            elapsed = time.time() - start_time
+            rate = current_count / elapsed if elapsed > 0 else 0
+            logger.info(f"Progress: {current_count}/{MAX_ARTICLES} articles, {len(self.queue)} queued, {rate:.2f} articles/sec")
+    
+    async def run_async(self):
+        """Crawl with concurrent tasks on a single event loop."""
+        self.semaphore = asyncio.Semaphore(MAX_WORKERS)
+        connector = aiohttp.TCPConnector(limit=CONNECTION_LIMIT, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
         
-        # Final batch insert
-        if self.article_batch:
-            self.batch_insert_articles(self.article_batch)
+        async with aiohttp.ClientSession(headers=HEADERS, connector=connector, timeout=timeout) as session:
+            self.session = session
+            
+            # Populate initial queue
+            await self.populate_initial_queue()
+            
+            if not self.queue:
+                logger.error("No articles in queue. Cannot start crawling.")
+                return
+            
+            # Start crawl tasks and the database writer
+            start_time = time.time()
+            self.write_queue = asyncio.Queue(maxsize=BATCH_SIZE * 4)
+            writer = asyncio.ensure_future(self.db_writer())
+            monitor = asyncio.ensure_future(self.report_progress(start_time))
+            try:
+                await asyncio.gather(*(self.worker(i) for i in range(MAX_WORKERS)))
+            finally:
+                monitor.cancel()
+                # Flush whatever is still queued even if a worker raised
+                await self.write_queue.put(None)
+                await writer
+                self.commit_pending()
+            
+            if len(self.visited) >= MAX_ARTICLES:
+                logger.info("Target reached!")
         
         # Final stats
         self.cursor.execute("SELECT COUNT(*) FROM wiki_articles")
@@ -415,6 +561,21 @@ class MassCrawler:
         logger.info(f"Total articles in database: {total_articles}")
         logger.info(f"Time elapsed: {elapsed:.2f} seconds")
         logger.info(f"Average rate: {total_articles/elapsed:.2f} articles/sec")
+    
+    def run(self):
+        """Run the mass crawler on an asyncio event loop."""
+        logger.info(f"Starting mass crawler - Target: {MAX_ARTICLES} articles")
+        
+        try:
+            asyncio.run(self.run_async())
+        except KeyboardInterrupt:
+            logger.info("Crawling interrupted - cancelling tasks...")
+            raise
+        finally:
+            # Let any in-flight insert finish, then index everything in one pass
+            self.db_executor.shutdown(wait=True)
+            self.commit_pending()
+            self.ensure_indexes()
 
 def main():
     """Main function to run the mass crawler."""
@@ -1,12 +1,11 @@
 import time
-import requests
 import mysql.connector
 from collections import deque
 import logging
-from bs4 import BeautifulSoup
-import re
 import json
-from typing import List, Tuple, Optional
+from typing import List, Tuple
+import crawler_core
+from crawler_core import clean_and_check, create_session
 
 # ----------------- Logging Setup -----------------
 logging.basicConfig(
@@ -34,79 +33,26 @@ CREATE TABLE IF NOT EXISTS wiki_articles (
     id INT AUTO_INCREMENT PRIMARY KEY,
     title VARCHAR(255) UNIQUE,
     summary TEXT,
-    content LONGTEXT,
     clean_content LONGTEXT,
     url VARCHAR(500),
     word_count INT DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     INDEX idx_title (title),
     INDEX idx_word_count (word_count),
-    FULLTEXT(title, summary, clean_content)
+    INDEX idx_created (created_at),
+    FULLTEXT(title, summary, clean_content),
+    FULLTEXT ft_title (title)
 )
 """)
 
-# ----------------- Wikipedia Endpoints -----------------
-summary_endpoint = "https://en.wikipedia.org/api/rest_v1/page/summary/{}"
-content_endpoint = "https://en.wikipedia.org/w/api.php?action=parse&page={}&format=json"
-category_members_endpoint = "https://en.wikipedia.org/w/api.php?action=query&list=categorymembers&cmtitle={}&cmlimit=500&format=json"
+# ----------------- HTTP Session -----------------
+SESSION = create_session()
 
 # ----------------- Crawler Setup -----------------
 visited = set()      # Already fetched articles
 queue = deque()      # BFS queue
 MAX_ARTICLES = 3000  # Optional limit
 
-# ----------------- Utility Functions -----------------
-def clean_html_content(html_content: str) -> str:
-    """Extract clean text from HTML content."""
-    if not html_content:
-        return ""
-    
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    # Remove script and style elements
-    for script in soup(["script", "style", "table", "div.navbox"]):
-        script.decompose()
-    
-    # Get text and clean up
-    text = soup.get_text()
-    text = re.sub(r'\s+', ' ', text).strip()
-    text = re.sub(r'\[.*?\]', '', text)  # Remove reference numbers
-    
-    return text
-
-def is_quality_article(title: str, content: str, summary: str) -> bool:
-    """Check if article meets quality criteria."""
-    # Skip disambiguation pages
-    if 'disambiguation' in title.lower() or 'may refer to' in summary.lower():
-        return False
-    
-    # Skip very short articles
-    if len(content) < 500:
-        return False
-    
-    # Skip list pages (usually not great for search)
-    if title.startswith('List of') or title.startswith('Index of'):
-        return False
-    
-    return True
-
-def retry_request(url: str, max_retries: int = 3) -> Optional[requests.Response]:
-    """Make HTTP request with retry logic."""
-    headers = {
-        'User-Agent': 'Mini Search Engine Bot/1.0 (Educational Project; Contact: user@example.com)'
-    }
-    
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, timeout=10, headers=headers)
-            response.raise_for_status()
-            return response
-        except requests.RequestException as e:
-            logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
-    return None
-
 # ----------------- Functions -----------------
 def fetch_article(title):
     """Fetch and save a Wikipedia article, return its linked articles."""
@@ -114,41 +60,26 @@ def fetch_article(title):
         return []
 
     try:
-        # Summary
-        summary_resp = retry_request(summary_endpoint.format(title))
-        if not summary_resp:
-            logger.error(f"Failed to fetch summary for {title}")
+        article = crawler_core.fetch_article(SESSION, title)
+        if not article:
+            logger.error(f"Failed to fetch {title}")
             return []
-        
-        summary_data = summary_resp.json()
-
-        # Full content with links
-        content_resp = retry_request(content_endpoint.format(title))
-        if not content_resp:
-            logger.error(f"Failed to fetch content for {title}")
-            return []
-        
-        content_data = content_resp.json()
 
-        article_title = summary_data.get('title', '')
-        summary = summary_data.get('extract', '')
-        url = summary_data.get('content_urls', {}).get('desktop', {}).get('page', '')
-        content = content_data.get('parse', {}).get('text', {}).get('*', '')
-        
-        # Clean the HTML content
-        clean_content = clean_html_content(content)
-        word_count = len(clean_content.split())
+        article_title = article['title']
+        summary = article['summary']
+        url = article['url']
         
-        # Check quality before saving
-        if not is_quality_article(article_title, clean_content, summary):
+        # Check quality and clean the HTML content
+        clean_content, word_count, is_quality = clean_and_check(article_title, summary, article['content'])
+        if not is_quality:
             logger.info(f"Skipping low-quality article: {article_title}")
             visited.add(title)
             return []
 
         # Save to MySQL
         try:
-            sql = "INSERT INTO wiki_articles (title, summary, content, clean_content, url, word_count) VALUES (%s, %s, %s, %s, %s, %s)"
-            cursor.execute(sql, (article_title, summary, content, clean_content, url, word_count))
+            sql = "INSERT INTO wiki_articles (title, summary, clean_content, url, word_count) VALUES (%s, %s, %s, %s, %s)"
+            cursor.execute(sql, (article_title, summary, clean_content, url, word_count))
             db.commit()
             logger.info(f"[+] Saved article: {article_title} ({word_count} words)")
         except mysql.connector.errors.IntegrityError:
@@ -156,11 +87,7 @@ def fetch_article(title):
 
         visited.add(title)
 
-        # Extract links (ns=0 -> main articles)
-        links = content_data.get('parse', {}).get('links', [])
-        linked_titles = [l['*'] for l in links if l.get('ns') == 0]
-
-        return linked_titles
+        return article['links']
 
     except Exception as e:
         logger.error(f"Error fetching {title}: {e}")
@@ -168,22 +95,10 @@ def fetch_article(title):
 
 def fetch_category_members(category):
     """Fetch pages and subcategories in a category."""
-    try:
-        members = []
-        url = category_members_endpoint.format(category)
-        resp = retry_request(url)
-        if not resp:
-            logger.error(f"Failed to fetch category {category}")
-            return []
-        
-        data = resp.json()
-
-        for member in data.get('query', {}).get('categorymembers', []):
-            members.append((member['title'], member['ns']))  # ns=0 -> page, ns=14 -> subcategory
-        return members
-    except Exception as e:
-        logger.error(f"Error fetching category {category}: {e}")
-        return []
+    members = crawler_core.fetch_category_members(SESSION, category)
+    if not members:
+        logger.error(f"Failed to fetch category {category}")
+    return members
 
 def crawl_category(seed_category):
     """Crawl category recursively, including links inside articles."""
@@ -1,148 +1,451 @@
-from flask import Flask, render_template, request, jsonify
-import mysql.connector
+from flask import Flask, render_template, request, jsonify, g, Response, stream_with_context
+from flask.json.provider import JSONProvider
+import mysql.connector.pooling
+from mysql.connector import errorcode
+import orjson
+import fulltext
+from decimal import Decimal
 import logging
-from typing import List, Dict, Any
+import time
+import hashlib
+import threading
+from cachetools import TTLCache
+from typing import List, Dict, Any, Tuple, Iterator
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson's C encoder."""
+    # Sorted keys, matching Flask's default provider output
+    OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NAIVE_UTC
+    
+    @staticmethod
+    def _default(obj):
+        # AVG() comes back as DECIMAL; Flask's default provider sent it as a string
+        if isinstance(obj, Decimal):
+            return str(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self._default, option=self.OPTIONS).decode()
+    
+    def loads(self, s, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any):
+        # Skip the str round trip: orjson already produces UTF-8 bytes
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self._default, option=self.OPTIONS)
+        return self._app.response_class(body, mimetype='application/json')
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Database connection pool, shared by all request threads
+DB_CONFIG = {
+    'host': "localhost",
+    'user': "root",
+    'password': "admin",
+    'database': "search_engine_db"
+}
+POOL_SIZE = 16
+
+# Sessions are not reset on return to the pool, so that server-side prepared
+# statements survive between requests; autocommit keeps each read from
+# holding a stale transaction snapshot instead. consume_results drains a
+# streamed result that was abandoned mid-way (e.g. the client disconnected).
+POOL = mysql.connector.pooling.MySQLConnectionPool(
+    pool_name="goggles",
+    pool_size=POOL_SIZE,
+    pool_reset_session=False,
+    autocommit=True,
+    consume_results=True,
+    **DB_CONFIG
+)
+
+# Larger /api/recent requests are streamed from an unbuffered cursor in batches
+STREAM_THRESHOLD = 100  # Rows; smaller results are built (and cached) in memory
+STREAM_BATCH_SIZE = 256
+ID_CHUNK_SIZE = 32768  # Placeholders per id lookup, well under the 65535 limit
+
+# Statements are module constants: a prepared cursor only re-prepares when
+# it is given a different SQL object than the one it executed last.
+# Column aliases are the API's JSON keys, so dictionary rows are returned as-is.
+
+# MATCH appears twice on purpose: the WHERE clause lets InnoDB answer from the
+# FULLTEXT index, and MySQL evaluates identical MATCH expressions only once.
+# Moving the filter to HAVING relevance > 0 would score every row instead.
+# Boolean mode with required prefix terms (see fulltext.boolean_query) narrows
+# multi-word candidates; queries without indexable words use SEARCH_NATURAL_SQL.
+SEARCH_SQL = """
+SELECT title, summary, url, word_count,
+       MATCH(title, summary, clean_content) AGAINST(%s IN BOOLEAN MODE) as relevance
+FROM wiki_articles 
+WHERE MATCH(title, summary, clean_content) AGAINST(%s IN BOOLEAN MODE)
+ORDER BY relevance DESC 
+LIMIT %s
+"""
+
+SEARCH_NATURAL_SQL = """
+SELECT title, summary, url, word_count,
+       MATCH(title, summary, clean_content) AGAINST(%s IN NATURAL LANGUAGE MODE) as relevance
+FROM wiki_articles 
+WHERE MATCH(title, summary, clean_content) AGAINST(%s IN NATURAL LANGUAGE MODE)
+ORDER BY relevance DESC 
+LIMIT %s
+"""
+
+# Word-prefix title search through the FULLTEXT ft_title index
+TITLE_SEARCH_SQL = """
+SELECT title, summary, url, word_count,
+       MATCH(title) AGAINST(%s IN BOOLEAN MODE) as relevance
+FROM wiki_articles 
+WHERE MATCH(title) AGAINST(%s IN BOOLEAN MODE)
+ORDER BY 
+    CASE 
+        WHEN title = %s THEN 1
+        WHEN title LIKE %s THEN 2
+        ELSE 3
+    END,
+    relevance DESC,
+    title
+LIMIT %s
+"""
+
+# Tables from the original schema may lack ft_title (setup.py adds it); until
+# then title search falls back to TITLE_LIKE_SQL, re-trying MATCH periodically
+TITLE_FULLTEXT_RETRY = 300  # Seconds
+_title_fulltext_retry_at = 0.0
+
+# Substring scan, for queries without indexable words or tables without ft_title
+# (1e0 is a DOUBLE literal, so relevance decodes to float like MATCH scores)
+TITLE_LIKE_SQL = """
+SELECT title, summary, url, word_count, 1e0 as relevance
+FROM wiki_articles 
+WHERE title LIKE %s
+ORDER BY 
+    CASE 
+        WHEN title = %s THEN 1
+        WHEN title LIKE %s THEN 2
+        ELSE 3
+    END,
+    title
+LIMIT %s
+"""
+
+STATS_SQL = """
+SELECT 
+    COUNT(*) as total,
+    AVG(word_count) as avg_words,
+    MAX(word_count) as max_words,
+    MIN(word_count) as min_words
+FROM wiki_articles
+"""
+
+# Dates are formatted by MySQL (%S, not %s, to stay clear of the placeholder);
+# ORDER BY names the table column so it sorts on idx_created, not the alias
+RECENT_SQL = """
+SELECT title, summary, url, word_count,
+       IFNULL(DATE_FORMAT(created_at, '%Y-%m-%d %H:%i:%S'), 'Unknown') as created_at
+FROM wiki_articles 
+ORDER BY wiki_articles.created_at DESC
+LIMIT %s
+"""
+
+# Everything a client needs for an article page, so it never re-queries by id
+ARTICLE_COLUMNS = """
+SELECT id, title, summary, clean_content, url, word_count,
+       IFNULL(DATE_FORMAT(created_at, '%Y-%m-%d %H:%i:%S'), 'Unknown') as created_at
+FROM wiki_articles 
+"""
+
+RECENT_FULL_SQL = ARTICLE_COLUMNS + """ORDER BY wiki_articles.created_at DESC
+LIMIT %s
+"""
+
+# Formatted with one placeholder per id
+ARTICLES_BY_IDS_SQL = ARTICLE_COLUMNS + "WHERE id IN ({})\n"
+
+# Stats and recent articles for the home page as one multi-statement round trip
+HOME_SQL = STATS_SQL.strip() + ";\n" + RECENT_SQL
+
+# Stats and recent articles change at crawl cadence, not per request
+STATS_CACHE_TTL = 30  # Seconds
+_STATS_CACHE = TTLCache(maxsize=1, ttl=STATS_CACHE_TTL)
+_RECENT_CACHE = TTLCache(maxsize=32, ttl=STATS_CACHE_TTL)  # Keyed by limit
+STATS_REFRESH_INTERVAL = STATS_CACHE_TTL / 2  # Refresh well before the entry expires
+# Hot queries (a small share of traffic is most of it) are served from memory
+SEARCH_CACHE_TTL = 60  # Seconds
+SEARCH_CACHE_SIZE = 1024
+_SEARCH_CACHE = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+_TITLE_CACHE = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+_CACHE_LOCK = threading.Lock()  # TTLCache is not thread-safe
+
+def _normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace; the _ci collation ignores case anyway."""
+    return ' '.join(query.lower().split())
+
+def _cache_get(cache: TTLCache, key):
+    """Thread-safe lookup; None on a miss or an expired entry."""
+    with _CACHE_LOCK:
+        return cache.get(key)
+
+def _cache_set(cache: TTLCache, key, value):
+    """Thread-safe store."""
+    with _CACHE_LOCK:
+        cache[key] = value
 
-# Database connection
 def get_db_connection():
-    return mysql.connector.connect(
-        host="localhost",
-        user="root",
-        password="admin",
-        database="search_engine_db"
-    )
+    """Lease a pooled connection for the current request, once."""
+    if 'db' not in g:
+        g.db = POOL.get_connection()
+    return g.db
 
-class SearchEngine:
-    def __init__(self):
-        self.db = get_db_connection()
-        self.cursor = self.db.cursor()
+def get_prepared_cursor(sql: str):
+    """Return the current connection's cached prepared cursor for sql."""
+    conn = get_db_connection()
+    cnx = conn._cnx  # The physical connection, reused across pool checkouts
+    
+    # Prepared statements die with the server session, so drop the cache on reconnect
+    cache = getattr(cnx, 'prepared_cursors', None)
+    if cache is None or cache[0] != cnx.connection_id:
+        cache = (cnx.connection_id, {})
+        cnx.prepared_cursors = cache
     
+    cursor = cache[1].get(sql)
+    if cursor is None:
+        cursor = cache[1][sql] = conn.cursor(prepared=True, dictionary=True)
+    return cursor
+
+@app.teardown_appcontext
+def release_db_connection(exception):
+    """Return the request's connection to the pool."""
+    conn = g.pop('db', None)
+    if conn is not None:
+        conn.close()
+
+class SearchEngine:
     def search_articles(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
         """Search articles using MySQL full-text search."""
+        query = _normalize_query(query)
+        cached = _cache_get(_SEARCH_CACHE, (query, limit))
+        if cached is not None:
+            return cached
+        
+        if not fulltext.TERM_RE.search(query):
+            return []  # Nothing searchable, e.g. only punctuation
+        
         try:
-            sql = """
-            SELECT title, summary, url, word_count,
-                   MATCH(title, summary, clean_content) AGAINST(%s IN NATURAL LANGUAGE MODE) as relevance
-            FROM wiki_articles 
-            WHERE MATCH(title, summary, clean_content) AGAINST(%s IN NATURAL LANGUAGE MODE)
-            ORDER BY relevance DESC 
-            LIMIT %s
-            """
-            self.cursor.execute(sql, (query, query, limit))
-            results = self.cursor.fetchall()
+            boolean_query = fulltext.boolean_query(query)
+            if boolean_query:
+                cursor = get_prepared_cursor(SEARCH_SQL)
+                cursor.execute(SEARCH_SQL, (boolean_query, boolean_query, limit))
+            else:
+                # Only stopwords and short words: let natural language mode rank what it can
+                cursor = get_prepared_cursor(SEARCH_NATURAL_SQL)
+                cursor.execute(SEARCH_NATURAL_SQL, (query, query, limit))
+            articles = cursor.fetchall()
             
-            return [
-                {
-                    'title': row[0],
-                    'summary': row[1],
-                    'url': row[2],
-                    'word_count': row[3],
-                    'relevance': float(row[4])
-                }
-                for row in results
-            ]
+            _cache_set(_SEARCH_CACHE, (query, limit), articles)
+            return articles
         except Exception as e:
             logger.error(f"Search error: {e}")
             return []
     
     def search_by_title(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
         """Search articles by title similarity."""
+        query = _normalize_query(query)
+        cached = _cache_get(_TITLE_CACHE, (query, limit))
+        if cached is not None:
+            return cached
+        
         try:
-            sql = """
-            SELECT title, summary, url, word_count
-            FROM wiki_articles 
-            WHERE title LIKE %s
-            ORDER BY 
-                CASE 
-                    WHEN title = %s THEN 1
-                    WHEN title LIKE %s THEN 2
-                    ELSE 3
-                END,
-                title
-            LIMIT %s
-            """
-            like_query = f"%{query}%"
             starts_query = f"{query}%"
-            self.cursor.execute(sql, (like_query, query, starts_query, limit))
-            results = self.cursor.fetchall()
+            boolean_query = fulltext.boolean_query(query)
+            
+            cursor = None
+            if boolean_query and time.time() >= _title_fulltext_retry_at:
+                cursor = self._title_fulltext_cursor(boolean_query, query, starts_query, limit)
+            if cursor is None:
+                cursor = get_prepared_cursor(TITLE_LIKE_SQL)
+                cursor.execute(TITLE_LIKE_SQL, (f"%{query}%", query, starts_query, limit))
+            articles = cursor.fetchall()
             
-            return [
-                {
-                    'title': row[0],
-                    'summary': row[1],
-                    'url': row[2],
-                    'word_count': row[3],
-                    'relevance': 1.0  # Default relevance for title search
-                }
-                for row in results
-            ]
+            _cache_set(_TITLE_CACHE, (query, limit), articles)
+            return articles
         except Exception as e:
             logger.error(f"Title search error: {e}")
             return []
     
+    @staticmethod
+    def _title_fulltext_cursor(boolean_query: str, query: str, starts_query: str, limit: int):
+        """Run TITLE_SEARCH_SQL; None if wiki_articles has no FULLTEXT index on title."""
+        global _title_fulltext_retry_at
+        cursor = get_prepared_cursor(TITLE_SEARCH_SQL)
+        try:
+            cursor.execute(TITLE_SEARCH_SQL, (boolean_query, boolean_query, query, starts_query, limit))
+            return cursor
+        except mysql.connector.Error as e:
+            if e.errno != errorcode.ER_FT_MATCHING_KEY_NOT_FOUND:
+                raise
+            _title_fulltext_retry_at = time.time() + TITLE_FULLTEXT_RETRY
+            logger.warning(f"No FULLTEXT index on wiki_articles.title (run setup.py); "
+                           f"using LIKE title search for {TITLE_FULLTEXT_RETRY}s")
+            return None
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics."""
+        cached = _cache_get(_STATS_CACHE, 'stats')
+        if cached is not None:
+            return cached
+        return self.refresh_stats()
+    
+    def refresh_stats(self) -> Dict[str, Any]:
+        """Query database statistics and store them in the cache."""
         try:
-            self.cursor.execute("""
-                SELECT 
-                    COUNT(*) as total,
-                    AVG(word_count) as avg_words,
-                    MAX(word_count) as max_words,
-                    MIN(word_count) as min_words
-                FROM wiki_articles
-            """)
-            stats = self.cursor.fetchone()
+            cursor = get_prepared_cursor(STATS_SQL)
+            cursor.execute(STATS_SQL)
+            stats = cursor.fetchall()[0]  # Drain the result so the cursor can be reused
             
-            return {
-                'total_articles': stats[0],
-                'avg_words': round(stats[1], 2) if stats[1] else 0,
-                'max_words': stats[2] if stats[2] else 0,
-                'min_words': stats[3] if stats[3] else 0
-            }
+            result = self._stats_from_row(stats)
+            _cache_set(_STATS_CACHE, 'stats', result)
+            return result
         except Exception as e:
             logger.error(f"Stats error: {e}")
             return {}
     
     def get_recent_articles(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recently added articles."""
+        cached = _cache_get(_RECENT_CACHE, limit)
+        if cached is not None:
+            return cached
+        
         try:
-            sql = """
-            SELECT title, summary, url, word_count, created_at
-            FROM wiki_articles 
-            ORDER BY created_at DESC
-            LIMIT %s
-            """
-            self.cursor.execute(sql, (limit,))
-            results = self.cursor.fetchall()
+            cursor = get_prepared_cursor(RECENT_SQL)
+            cursor.execute(RECENT_SQL, (limit,))
+            recent = cursor.fetchall()
             
-            return [
-                {
-                    'title': row[0],
-                    'summary': row[1],
-                    'url': row[2],
-                    'word_count': row[3],
-                    'created_at': row[4].strftime('%Y-%m-%d %H:%M:%S') if row[4] else 'Unknown'
-                }
-                for row in results
-            ]
+            _cache_set(_RECENT_CACHE, limit, recent)
+            return recent
         except Exception as e:
             logger.error(f"Recent articles error: {e}")
             return []
+    
+    def get_recent_full(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get recently added articles with their ids and full content."""
+        try:
+            cursor = get_prepared_cursor(RECENT_FULL_SQL)
+            cursor.execute(RECENT_FULL_SQL, (limit,))
+            return cursor.fetchall()
+        except Exception as e:
+            logger.error(f"Recent full articles error: {e}")
+            return []
+    
+    def get_articles_by_ids(self, ids: List[int]) -> List[Dict[str, Any]]:
+        """Get articles by id in one query per ID_CHUNK_SIZE ids, in requested order."""
+        unique_ids = list(dict.fromkeys(ids))
+        by_id = {}
+        try:
+            # Plain cursor: the statement text varies with the number of ids
+            with get_db_connection().cursor(dictionary=True) as cursor:
+                for start in range(0, len(unique_ids), ID_CHUNK_SIZE):
+                    chunk = unique_ids[start:start + ID_CHUNK_SIZE]
+                    cursor.execute(ARTICLES_BY_IDS_SQL.format(','.join(['%s'] * len(chunk))), chunk)
+                    by_id.update((row['id'], row) for row in cursor.fetchall())
+        except Exception as e:
+            logger.error(f"Articles by id error: {e}")
+            return []
+        
+        # Reassemble in the caller's order, skipping ids that don't exist
+        return [by_id[article_id] for article_id in ids if article_id in by_id]
+    
+    def iter_recent_articles(self, limit: int, full: bool = False) -> Iterator[Dict[str, Any]]:
+        """Stream recently added articles without materializing the result."""
+        try:
+            # Unbuffered text cursor: rows are read off the socket as they are fetched
+            with get_db_connection().cursor(dictionary=True, buffered=False) as cursor:
+                cursor.execute(RECENT_FULL_SQL if full else RECENT_SQL, (limit,))
+                while True:
+                    rows = cursor.fetchmany(STREAM_BATCH_SIZE)
+                    if not rows:
+                        break
+                    yield from rows
+        except Exception as e:
+            logger.error(f"Recent articles stream error: {e}")
+    
+    def get_home_page(self, limit: int = 5) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Get statistics and recent articles in a single round trip."""
+        stats = _cache_get(_STATS_CACHE, 'stats')
+        recent = _cache_get(_RECENT_CACHE, limit)
+        if stats is not None and recent is not None:
+            return stats, recent
+        
+        try:
+            # Multi-statement text query; prepared statements can't return two result sets
+            with get_db_connection().cursor(dictionary=True) as cursor:
+                cursor.execute(HOME_SQL, (limit,))
+                stats = self._stats_from_row(cursor.fetchall()[0])
+                cursor.nextset()
+                recent = cursor.fetchall()
+            
+            _cache_set(_STATS_CACHE, 'stats', stats)
+            _cache_set(_RECENT_CACHE, limit, recent)
+            return stats, recent
+        except Exception as e:
+            logger.error(f"Home page error: {e}")
+            return {}, []
+    
+    @staticmethod
+    def _stats_from_row(stats) -> Dict[str, Any]:
+        """Shape a STATS_SQL row for the API."""
+        return {
+            'total_articles': stats['total'],
+            'avg_words': round(stats['avg_words'], 2) if stats['avg_words'] else 0,
+            'max_words': stats['max_words'] if stats['max_words'] else 0,
+            'min_words': stats['min_words'] if stats['min_words'] else 0
+        }
 
 # Initialize search engine
 search_engine = SearchEngine()
 
+_refresher_started = False
+
+def refresh_stats_forever():
+    """Keep the stats cache warm so requests never wait on the aggregate."""
+    while True:
+        # An app context of its own, so the pooled connection is leased and returned
+        with app.app_context():
+            search_engine.refresh_stats()
+        time.sleep(STATS_REFRESH_INTERVAL)
+
+@app.before_request
+def start_stats_refresher():
+    """Start the background stats refresher on this process's first request."""
+    global _refresher_started
+    if _refresher_started:
+        return
+    with _CACHE_LOCK:
+        if _refresher_started:
+            return
+        _refresher_started = True
+    threading.Thread(target=refresh_stats_forever, name='stats-refresher', daemon=True).start()
+
+def cacheable_json(payload: Any) -> Response:
+    """JSON response that browsers and proxies may cache; 304 if the ETag matches."""
+    response = jsonify(payload)
+    if not payload:
+        return response  # Possibly a DB error; don't let caches hold on to it
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest())
+    response.cache_control.public = True
+    response.cache_control.max_age = STATS_CACHE_TTL
+    return response.make_conditional(request)
+
 @app.route('/')
 def index():
     """Main search page."""
-    stats = search_engine.get_stats()
-    recent_articles = search_engine.get_recent_articles(5)
+    stats, recent_articles = search_engine.get_home_page(5)
     return render_template('index.html', stats=stats, recent_articles=recent_articles)
 
 @app.route('/search')
@@ -169,15 +472,51 @@ def search():
 @app.route('/api/stats')
 def api_stats():
     """API endpoint for statistics."""
-    return jsonify(search_engine.get_stats())
+    return cacheable_json(search_engine.get_stats())
 
 @app.route('/api/recent')
 def api_recent():
     """API endpoint for recent articles."""
     limit = request.args.get('limit', 10, type=int)
-    return jsonify(search_engine.get_recent_articles(limit))
+    if limit > STREAM_THRESHOLD:
+        rows = search_engine.iter_recent_articles(limit)
+        return Response(stream_with_context(_json_array(rows)), mimetype='application/json')
+    return cacheable_json(search_engine.get_recent_articles(limit))
 
-if __name__ == '__main__':
+@app.route('/api/recent_full')
+def api_recent_full():
+    """API endpoint for recent articles with ids and full content."""
+    limit = request.args.get('limit', 10, type=int)
+    if limit > STREAM_THRESHOLD:
+        rows = search_engine.iter_recent_articles(limit, full=True)
+        return Response(stream_with_context(_json_array(rows)), mimetype='application/json')
+    return jsonify(search_engine.get_recent_full(limit))
+
+@app.route('/api/articles')
+def api_articles():
+    """API endpoint for articles by id, e.g. /api/articles?ids=3,1,2."""
+    try:
+        ids = [int(i) for i in request.args.get('ids', '').split(',') if i.strip()]
+    except ValueError:
+        return jsonify({'error': 'ids must be comma-separated integers'}), 400
+    
+    if not ids:
+        return jsonify({'error': 'No ids provided'}), 400
+    
+    return jsonify(search_engine.get_articles_by_ids(ids))
+
+def _json_array(rows: Iterator[Dict[str, Any]]) -> Iterator[str]:
+    """Encode rows as a JSON array one element at a time."""
+    yield '['
+    for i, row in enumerate(rows):
+        yield ',' + app.json.dumps(row) if i else app.json.dumps(row)
+    yield ']'
+
+def main(use_reloader: bool = True):
+    """Run the development web server."""
     print("Starting Mini Search Engine Web Interface...")
     print("Visit http://localhost:5000 to access the search interface")
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(debug=True, host='0.0.0.0', port=5000, use_reloader=use_reloader)
+
+if __name__ == '__main__':
+    main()
@@ -5,9 +5,31 @@ Setup script for Mini Wikipedia Search Engine
 
 import os
 import sys
+import atexit
 import subprocess
-import mysql.connector
-from mysql.connector import Error
+
+# One MySQL connection shared by every setup phase, opened on first use
+_connection = None
+
+def get_mysql_connection():
+    """Return the shared MySQL connection, reconnecting if it was dropped."""
+    global _connection
+    # Imported here: the driver may only exist after install_requirements() runs
+    import mysql.connector
+    
+    if _connection is None or not _connection.is_connected():
+        # Try to connect with default settings
+        _connection = mysql.connector.connect(
+            host='localhost',
+            user='root',
+            password='admin'  # Default from your current setup
+        )
+    return _connection
+
+def close_mysql_connection():
+    """Close the shared MySQL connection, if one was opened."""
+    if _connection is not None and _connection.is_connected():
+        _connection.close()
 
 def check_python_version():
     """Check if Python version is compatible."""
@@ -21,7 +43,14 @@ def install_requirements():
     """Install required packages."""
     try:
         print("📦 Installing Python packages...")
-        subprocess.check_call([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'])
+        # Prefer prebuilt wheels so C extensions are not compiled from source
+        command = [sys.executable, '-m', 'pip', 'install', '--prefer-binary',
+                   '--disable-pip-version-check', '-r', 'requirements.txt']
+        # Optional shared wheelhouse, e.g. built once with `pip wheel -r requirements.txt -w <dir>`
+        wheels_dir = os.environ.get('PIP_WHEELS_DIR')
+        if wheels_dir:
+            command += ['--find-links', wheels_dir]
+        subprocess.check_call(command)
         print("✅ All packages installed successfully")
         return True
     except subprocess.CalledProcessError:
@@ -30,35 +59,73 @@ def install_requirements():
 
 def test_mysql_connection():
     """Test MySQL connection."""
+    from mysql.connector import Error
+    
     try:
-        # Try to connect with default settings
-        connection = mysql.connector.connect(
-            host='localhost',
-            user='root',
-            password='admin'  # Default from your current setup
-        )
+        connection = get_mysql_connection()
         if connection.is_connected():
             print("✅ MySQL connection successful")
             
             cursor = connection.cursor()
-            cursor.execute("SHOW DATABASES")
-            databases = cursor.fetchall()
             
-            # Check if our database exists
-            db_exists = any('search_engine_db' in db for db in databases)
+            # Check if our database exists (exact name match, at most one row)
+            cursor.execute(
+                "SELECT 1 FROM information_schema.schemata WHERE schema_name = %s",
+                ('search_engine_db',)
+            )
+            db_exists = cursor.fetchone() is not None
             if db_exists:
                 print("✅ Database 'search_engine_db' found")
             else:
                 print("⚠️  Database 'search_engine_db' not found - will be created automatically")
             
             cursor.close()
-            connection.close()
             return True
     except Error as e:
         print(f"❌ MySQL connection failed: {e}")
         print("💡 Make sure MySQL is running and credentials are correct")
         return False
 
+# Indexes the web interface relies on that tables from older schemas lack:
+# title search and suggestions use MATCH(title), /api/recent sorts by created_at
+SEARCH_INDEXES = [
+    ('ft_title', 'FULLTEXT INDEX ft_title (title)'),
+    ('idx_created', 'INDEX idx_created (created_at)')
+]
+
+def ensure_search_indexes():
+    """Add any SEARCH_INDEXES missing from wiki_articles."""
+    from mysql.connector import Error
+    
+    try:
+        cursor = get_mysql_connection().cursor()
+        cursor.execute(
+            "SELECT 1 FROM information_schema.tables WHERE table_schema = %s AND table_name = %s",
+            ('search_engine_db', 'wiki_articles')
+        )
+        if cursor.fetchone() is None:
+            print("⚠️  Table 'wiki_articles' not found - the crawler creates it with all indexes")
+            cursor.close()
+            return True
+        
+        for name, definition in SEARCH_INDEXES:
+            cursor.execute(
+                "SELECT 1 FROM information_schema.statistics "
+                "WHERE table_schema = %s AND table_name = %s AND index_name = %s LIMIT 1",
+                ('search_engine_db', 'wiki_articles', name)
+            )
+            if cursor.fetchone() is None:
+                # Building an index on a large table can take a while
+                print(f"📇 Adding index {name} on wiki_articles...")
+                cursor.execute(f"ALTER TABLE search_engine_db.wiki_articles ADD {definition}")
+        print("✅ Search indexes present")
+        
+        cursor.close()
+        return True
+    except Error as e:
+        print(f"❌ Could not create search indexes: {e}")
+        return False
+
 def create_config_file():
     """Create config file from template."""
     if not os.path.exists('config.py'):
@@ -74,6 +141,7 @@ def create_config_file():
 
 def main():
     """Main setup function."""
+    atexit.register(close_mysql_connection)
     print("🚀 Setting up Mini Wikipedia Search Engine...")
     print("=" * 50)
     
@@ -81,6 +149,7 @@ def main():
         ("Python Version", check_python_version),
         ("Install Packages", install_requirements),
         ("MySQL Connection", test_mysql_connection),
+        ("Search Indexes", ensure_search_indexes),
         ("Config File", create_config_file)
     ]
     
@@ -0,0 +1,46 @@
+"""
+Tests for the title suggestion queries in advanced_search.py
+Run with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
+
+import advanced_search
+
+
+class SearchSuggestionsTest(unittest.TestCase):
+    def setUp(self):
+        # The engine opens its connection pool on construction; no database is needed here
+        with mock.patch('mysql.connector.pooling.MySQLConnectionPool'):
+            self.engine = advanced_search.AdvancedSearchEngine()
+        self.engine._has_title_fulltext = True
+        self.cursor = mock.Mock()
+
+    def test_starts_with_and_fulltext_run_as_separate_queries(self):
+        self.cursor.fetchall.side_effect = [
+            [("History of science",)],
+            [("History of science",), ("Science history",)],
+        ]
+        suggestions = self.engine._search_suggestions(self.cursor, "history of sc", 5)
+        
+        self.assertEqual(suggestions, ["History of science", "Science history"])
+        (starts_sql, starts_params), (match_sql, match_params) = [c[0] for c in self.cursor.execute.call_args_list]
+        # Neither query ORs MATCH with another condition, so both can use an index
+        self.assertNotIn("MATCH", starts_sql)
+        self.assertNotIn(" OR ", match_sql)
+        self.assertEqual(starts_params, ("history of sc%", 5))
+        self.assertEqual(match_params, ("+history*", 5))
+
+    def test_fulltext_query_skipped_when_prefix_matches_fill_the_limit(self):
+        self.cursor.fetchall.return_value = [("Python",), ("Pythonidae",)]
+        self.assertEqual(self.engine._search_suggestions(self.cursor, "pyth", 2), ["Python", "Pythonidae"])
+        self.assertEqual(self.cursor.execute.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
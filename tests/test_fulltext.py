@@ -0,0 +1,33 @@
+"""
+Tests for the shared boolean-mode query builder in fulltext.py
+Run with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
+
+import fulltext
+
+
+class BooleanQueryTest(unittest.TestCase):
+    def test_every_word_is_a_required_prefix(self):
+        self.assertEqual(fulltext.boolean_query("machine lea"), "+machine* +lea*")
+
+    def test_stopwords_are_dropped(self):
+        self.assertEqual(fulltext.boolean_query("what is the python language"), "+python* +language*")
+
+    def test_short_words_are_dropped(self):
+        self.assertEqual(fulltext.boolean_query("history of sc"), "+history*")
+
+    def test_operators_are_stripped(self):
+        self.assertEqual(fulltext.boolean_query('-java +"rust" (go*)'), "+java* +rust*")
+
+    def test_only_unindexed_words_gives_empty_query(self):
+        self.assertEqual(fulltext.boolean_query("c is a"), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
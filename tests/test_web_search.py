@@ -0,0 +1,45 @@
+"""
+Tests for the full-text search queries in web_search.py
+Run with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
+
+# web_search opens its connection pool at import time; no database is needed here
+with mock.patch('mysql.connector.pooling.MySQLConnectionPool'):
+    import web_search
+
+
+class SearchArticlesTest(unittest.TestCase):
+    def setUp(self):
+        web_search._SEARCH_CACHE.clear()
+        self.cursor = mock.Mock()
+        self.cursor.fetchall.return_value = []
+        patcher = mock.patch.object(web_search, 'get_prepared_cursor', return_value=self.cursor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_query_with_stopwords_requires_only_indexable_words(self):
+        web_search.SearchEngine().search_articles("what is python")
+        sql, params = self.cursor.execute.call_args[0]
+        self.assertIs(sql, web_search.SEARCH_SQL)
+        self.assertEqual(params, ("+python*", "+python*", 20))
+
+    def test_only_stopwords_falls_back_to_natural_language(self):
+        web_search.SearchEngine().search_articles("Who is It")
+        sql, params = self.cursor.execute.call_args[0]
+        self.assertIs(sql, web_search.SEARCH_NATURAL_SQL)
+        self.assertEqual(params, ("who is it", "who is it", 20))
+
+    def test_punctuation_only_skips_the_database(self):
+        self.assertEqual(web_search.SearchEngine().search_articles("?!"), [])
+        self.cursor.execute.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()